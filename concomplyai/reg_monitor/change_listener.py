@@ -141,12 +141,8 @@ class RegulatoryChangeListener:
 
         if new_version == source.current_version:
             # Update last_checked timestamp even when no change is found.
-            self._sources[source_id] = RegulatorySource(
-                source_id=source.source_id,
-                name=source.name,
-                current_version=source.current_version,
-                url=source.url,
-                last_checked=datetime.now(timezone.utc),
+            self._sources[source_id] = source.model_copy(
+                update={"last_checked": datetime.now(timezone.utc)}
             )
             return None
 
@@ -165,12 +161,11 @@ class RegulatoryChangeListener:
         )
 
         # Replace source record with updated version.
-        self._sources[source_id] = RegulatorySource(
-            source_id=source.source_id,
-            name=source.name,
-            current_version=new_version,
-            url=source.url,
-            last_checked=datetime.now(timezone.utc),
+        self._sources[source_id] = source.model_copy(
+            update={
+                "current_version": new_version,
+                "last_checked": datetime.now(timezone.utc),
+            }
         )
 
         logger.info(
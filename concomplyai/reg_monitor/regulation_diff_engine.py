@@ -9,6 +9,7 @@ from __future__ import annotations
 import difflib
 import logging
 import uuid
+from bisect import bisect_left
 from datetime import datetime, timezone
 from typing import Literal
 
@@ -17,6 +18,25 @@ from pydantic import BaseModel, ConfigDict, Field
 logger = logging.getLogger(__name__)
 
 
+def _format_hunk_range(start: int, stop: int) -> str:
+    """Format a ``[start, stop)`` line range as a unified-diff hunk range.
+
+    Args:
+        start: Zero-based index of the first line in the range.
+        stop: Zero-based index one past the last line in the range.
+
+    Returns:
+        ``"line"`` for single lines, otherwise ``"line,length"``.
+    """
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
 class RegulationDiff(BaseModel):
     """Immutable result of comparing two regulation text versions."""
 
@@ -58,13 +78,24 @@ class RegulationDiffEngine:
         * > 50 % → BREAKING
     """
 
-    @staticmethod
+    # Upper bounds (inclusive) of each severity band, paired with the
+    # label assigned to ratios that fall at or below that bound.
+    _SEVERITY_THRESHOLDS: tuple[float, ...] = (0.05, 0.20, 0.50)
+    _SEVERITY_LEVELS: tuple[
+        Literal["MINOR", "MODERATE", "MAJOR", "BREAKING"], ...
+    ] = ("MINOR", "MODERATE", "MAJOR", "BREAKING")
+
+    @classmethod
     def _classify_severity(
+        cls,
         changed_count: int,
         total_lines: int,
     ) -> Literal["MINOR", "MODERATE", "MAJOR", "BREAKING"]:
         """Return a severity label based on changed-line ratio.
 
+        The ratio is located in ``_SEVERITY_THRESHOLDS`` with a binary
+        search instead of an if/elif ladder.
+
         Args:
             changed_count: Number of added + removed lines.
             total_lines: Max of old/new line counts (baseline).
@@ -75,13 +106,7 @@ class RegulationDiffEngine:
         if total_lines == 0:
             return "MINOR"
         ratio = changed_count / total_lines
-        if ratio > 0.50:
-            return "BREAKING"
-        if ratio > 0.20:
-            return "MAJOR"
-        if ratio > 0.05:
-            return "MODERATE"
-        return "MINOR"
+        return cls._SEVERITY_LEVELS[bisect_left(cls._SEVERITY_THRESHOLDS, ratio)]
 
     def compute_diff(self, old_text: str, new_text: str) -> RegulationDiff:
         """Compare *old_text* and *new_text* and return a ``RegulationDiff``.
@@ -94,27 +119,37 @@ class RegulationDiffEngine:
             A ``RegulationDiff`` containing added/removed lines, modified
             section markers, and a severity classification.
         """
+        if old_text == new_text:
+            # Identical texts cannot differ; skip line splitting and difflib.
+            diff = RegulationDiff(change_severity="MINOR")
+            logger.info(
+                '{"action":"compute_diff","diff_id":"%s","added":0,"removed":0,"severity":"MINOR"}',
+                diff.diff_id,
+            )
+            return diff
+
         old_lines = old_text.splitlines(keepends=False)
         new_lines = new_text.splitlines(keepends=False)
 
-        differ = difflib.unified_diff(
-            old_lines,
-            new_lines,
-            lineterm="",
-            n=1,
-        )
-
         added: list[str] = []
         removed: list[str] = []
         modified_sections: list[str] = []
 
-        for line in differ:
-            if line.startswith("@@"):
-                modified_sections.append(line.strip())
-            elif line.startswith("+") and not line.startswith("+++"):
-                added.append(line[1:])
-            elif line.startswith("-") and not line.startswith("---"):
-                removed.append(line[1:])
+        # Walk the matcher's hunks directly rather than formatting a
+        # unified diff and re-parsing its "+"/"-" prefixed output, so
+        # changed lines are sliced from the inputs without copies.
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+        for group in matcher.get_grouped_opcodes(1):
+            first, last = group[0], group[-1]
+            modified_sections.append(
+                f"@@ -{_format_hunk_range(first[1], last[2])} "
+                f"+{_format_hunk_range(first[3], last[4])} @@"
+            )
+            for tag, i1, i2, j1, j2 in group:
+                if tag in ("replace", "delete"):
+                    removed.extend(old_lines[i1:i2])
+                if tag in ("replace", "insert"):
+                    added.extend(new_lines[j1:j2])
 
         total_lines = max(len(old_lines), len(new_lines), 1)
         changed_count = len(added) + len(removed)
@@ -21,6 +21,38 @@ from concomplyai.reg_monitor.regulation_diff_engine import RegulationDiff
 logger = logging.getLogger(__name__)
 
 
+# Risk level -> (action, priority, deadline_days, description).
+_RECOMMENDATION_POLICY: dict[
+    str,
+    tuple[Literal["UPDATE", "REVIEW", "DEPRECATE", "NO_ACTION"], int, int, str],
+] = {
+    "CRITICAL": (
+        "UPDATE",
+        1,
+        7,
+        "Immediate rule update required due to critical regulatory change.",
+    ),
+    "HIGH": (
+        "UPDATE",
+        2,
+        14,
+        "Rule update recommended within two weeks due to high-impact change.",
+    ),
+    "MEDIUM": (
+        "REVIEW",
+        3,
+        30,
+        "Review rule for potential adjustments following moderate change.",
+    ),
+    "LOW": (
+        "NO_ACTION",
+        5,
+        90,
+        "No immediate action needed; schedule routine review.",
+    ),
+}
+
+
 class ImpactAssessment(BaseModel):
     """Immutable record of a regulatory-change impact assessment."""
 
@@ -234,45 +266,20 @@ class RuleUpdater:
         Returns:
             List of ``UpdateRecommendation`` instances, one per impacted rule.
         """
-        action_map: dict[str, tuple[Literal["UPDATE", "REVIEW", "DEPRECATE", "NO_ACTION"], int, int, str]] = {
-            "CRITICAL": (
-                "UPDATE",
-                1,
-                7,
-                "Immediate rule update required due to critical regulatory change.",
-            ),
-            "HIGH": (
-                "UPDATE",
-                2,
-                14,
-                "Rule update recommended within two weeks due to high-impact change.",
-            ),
-            "MEDIUM": (
-                "REVIEW",
-                3,
-                30,
-                "Review rule for potential adjustments following moderate change.",
-            ),
-            "LOW": (
-                "NO_ACTION",
-                5,
-                90,
-                "No immediate action needed; schedule routine review.",
-            ),
-        }
-
-        action, priority, deadline, description = action_map[assessment.risk_level]
+        action, priority, deadline, description = _RECOMMENDATION_POLICY[
+            assessment.risk_level
+        ]
 
-        recommendations: list[UpdateRecommendation] = []
-        for rule_id in assessment.impacted_rules:
-            rec = UpdateRecommendation(
+        recommendations = [
+            UpdateRecommendation(
                 rule_id=rule_id,
                 action=action,
                 description=description,
                 priority=priority,
                 deadline_days=deadline,
             )
-            recommendations.append(rec)
+            for rule_id in assessment.impacted_rules
+        ]
 
         logger.info(
             '{"action":"generate_recommendations","assessment_id":"%s","count":%d}',
@@ -11,6 +11,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import operator
 import uuid
 from datetime import datetime, timezone
 
@@ -56,11 +57,12 @@ class RiskScoreCalculator:
         if not factors:
             return 0.0
 
-        total_weight = sum(f.weight for f in factors)
+        weights = [f.weight for f in factors]
+        total_weight = sum(weights)
         if total_weight == 0.0:
             return 0.0
 
-        weighted_sum = sum(f.weight * f.current_value for f in factors)
+        weighted_sum = sum(map(operator.mul, weights, (f.current_value for f in factors)))
         score = weighted_sum / total_weight
         return round(max(0.0, min(100.0, score)), 2)
 
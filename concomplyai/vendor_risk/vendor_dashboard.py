@@ -8,6 +8,7 @@ shared ``EventBus``.
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Literal
 
@@ -220,20 +221,15 @@ class VendorDashboard:
             )
             return summary
 
-        high_count = sum(
-            1 for s in self._scores.values() if s.risk_level == "HIGH"
-        )
-        critical_count = sum(
-            1 for s in self._scores.values() if s.risk_level == "CRITICAL"
-        )
-        avg_score = round(
-            sum(s.overall_score for s in self._scores.values()) / total, 2
-        )
+        scores = self._scores.values()
+        level_counts = Counter(s.risk_level for s in scores)
+        high_count = level_counts["HIGH"]
+        critical_count = level_counts["CRITICAL"]
+        avg_score = round(sum(s.overall_score for s in scores) / total, 2)
 
-        all_factors: list[str] = []
-        for s in self._scores.values():
-            all_factors.extend(s.risk_factors)
-        top_risks = sorted(set(all_factors))[:10]
+        top_risks = sorted(
+            {factor for s in scores for factor in s.risk_factors}
+        )[:10]
 
         summary = ExposureSummary(
             total_vendors=total,
@@ -273,11 +269,11 @@ class VendorDashboard:
         if profile is None or score is None:
             return None
 
-        active_certs = sum(1 for c in profile.certifications if c.is_valid)
+        active_certs = sum(c.is_valid for c in profile.certifications)
         expired_certs = len(profile.certifications) - active_certs
 
         total_checks = len(profile.compliance_history)
-        passed_checks = sum(1 for r in profile.compliance_history if r.passed)
+        passed_checks = sum(r.passed for r in profile.compliance_history)
         pass_rate = round(
             (passed_checks / total_checks * 100.0) if total_checks > 0 else 0.0,
             2,
@@ -135,10 +135,66 @@ class VendorRiskScorer:
 
     CERT_WEIGHT: float = 0.4
     COMPLIANCE_WEIGHT: float = 0.6
+    CACHE_SIZE: int = 1024
+
+    def __init__(self) -> None:
+        self._cache: dict[tuple, VendorRiskScore] = {}
+
+    @staticmethod
+    def _profile_key(profile: VendorProfile) -> tuple:
+        """Build a hashable key from every profile field that affects scoring.
+
+        Args:
+            profile: The vendor profile to key.
+
+        Returns:
+            Tuple of vendor id, certification and compliance record content.
+        """
+        return (
+            profile.vendor_id,
+            tuple((c.cert_id, c.name, c.is_valid) for c in profile.certifications),
+            tuple(
+                (r.record_id, r.passed, r.category, r.details)
+                for r in profile.compliance_history
+            ),
+        )
 
     def score_vendor(self, profile: VendorProfile) -> VendorRiskScore:
         """Compute a risk score for the given vendor profile.
 
+        Scoring is memoised by profile content. Re-scoring an unchanged
+        profile skips the computation but still returns a fresh snapshot
+        (new ``score_id`` and ``scored_at``, own ``risk_factors`` list),
+        so callers never share or mutate the cached entry.
+
+        Args:
+            profile: The vendor profile to evaluate.
+
+        Returns:
+            An immutable ``VendorRiskScore`` with integrity hash.
+        """
+        key = self._profile_key(profile)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._compute_score(profile)
+            if len(self._cache) >= self.CACHE_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order).
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = cached
+
+        # score_hash covers only the score content, so it stays valid
+        # for the new snapshot identity.
+        return cached.model_copy(
+            update={
+                "score_id": str(uuid.uuid4()),
+                "scored_at": datetime.now(timezone.utc),
+            },
+            deep=True,
+        )
+
+    def _compute_score(self, profile: VendorProfile) -> VendorRiskScore:
+        """Score *profile* without consulting the cache.
+
         Args:
             profile: The vendor profile to evaluate.
 
@@ -193,12 +249,12 @@ class VendorRiskScorer:
             risk_factors.append("No certifications on file")
             return 0.0
 
-        valid_count = 0
-        for cert in certs:
-            if cert.is_valid:
-                valid_count += 1
-            else:
-                risk_factors.append(f"Expired certification: {cert.name}")
+        risk_factors.extend(
+            f"Expired certification: {cert.name}"
+            for cert in certs
+            if not cert.is_valid
+        )
+        valid_count = sum(cert.is_valid for cert in certs)
 
         return round((valid_count / len(certs)) * 100.0, 2)
 
@@ -219,13 +275,11 @@ class VendorRiskScorer:
             risk_factors.append("No compliance history available")
             return 0.0
 
-        passed_count = 0
-        for record in records:
-            if record.passed:
-                passed_count += 1
-            else:
-                risk_factors.append(
-                    f"Failed compliance check: {record.category} - {record.details}"
-                )
+        risk_factors.extend(
+            f"Failed compliance check: {record.category} - {record.details}"
+            for record in records
+            if not record.passed
+        )
+        passed_count = sum(record.passed for record in records)
 
         return round((passed_count / len(records)) * 100.0, 2)
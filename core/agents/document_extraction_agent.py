@@ -1,5 +1,5 @@
 """Document Extraction Agent - OCR and field extraction for contractor documents"""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable
 from datetime import datetime
 import hashlib
 import re
@@ -10,6 +10,25 @@ from core.models import (
 from core.config import calculate_token_cost
 
 
+# Combined PII scanner: one named group per PII type. Email is tried first so
+# digit runs inside an address are not misreported as phone numbers.
+_PII_PATTERN = re.compile(
+    r'(?P<Email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<SSN>\b\d{3}-\d{2}-\d{4}\b)'
+    r'|(?P<Phone>\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)'
+)
+_SSN_REDACT_RE = re.compile(r'\d{3}-\d{2}-(\d{4})')
+_PHONE_REDACT_RE = re.compile(r'\d{3}[-.]?\d{3}[-.]?(\d{4})')
+
+# Redaction per PII type, in reporting order. SSN and phone keep the last four
+# digits in place; emails are masked entirely for security.
+_PII_REDACTORS: Dict[str, Callable[[str], str]] = {
+    "SSN": lambda value: _SSN_REDACT_RE.sub(r'***-**-\1', value),
+    "Phone": lambda value: _PHONE_REDACT_RE.sub(r'***-***-\1', value),
+    "Email": lambda value: '***@***',
+}
+
+
 def extract_document_fields(state: DocumentExtractionState) -> dict:
     """
     Extract fields from contractor documents with confidence scoring and source coordinates
@@ -315,57 +334,30 @@ def _detect_pii(fields: List[ExtractedField]) -> List[PIIRedaction]:
     - SSN: XXX-XX-XXXX
     - Phone: (XXX) XXX-XXXX
     - Email: ***@***.com
+    
+    All patterns are scanned in a single pass per field; the alternation
+    group that matched names the PII type.
     """
     pii_redactions = []
     
-    # SSN pattern
-    ssn_pattern = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
-    # Phone pattern
-    phone_pattern = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
-    # Email pattern
-    email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-    
     for field in fields:
         value_str = str(field.value)
+        found = {match.lastgroup for match in _PII_PATTERN.finditer(value_str)}
+        if not found:
+            continue
         
-        # Check for SSN
-        if ssn_pattern.search(value_str):
-            original_hash = hashlib.sha256(value_str.encode()).hexdigest()
-            redacted = re.sub(r'\d{3}-\d{2}-(\d{4})', r'***-**-\1', value_str)
-            pii_redactions.append(PIIRedaction(
-                field_name=field.field_name,
-                original_value_hash=original_hash,
-                pii_type="SSN",
-                redacted_value=redacted,
-                redaction_method="regex"
-            ))
-            field.redacted = True
-        
-        # Check for phone
-        if phone_pattern.search(value_str):
-            original_hash = hashlib.sha256(value_str.encode()).hexdigest()
-            redacted = re.sub(r'\d{3}[-.]?\d{3}[-.]?(\d{4})', r'***-***-\1', value_str)
-            pii_redactions.append(PIIRedaction(
-                field_name=field.field_name,
-                original_value_hash=original_hash,
-                pii_type="Phone",
-                redacted_value=redacted,
-                redaction_method="regex"
-            ))
-            field.redacted = True
+        original_hash = hashlib.sha256(value_str.encode()).hexdigest()
         
-        # Check for email
-        if email_pattern.search(value_str):
-            original_hash = hashlib.sha256(value_str.encode()).hexdigest()
-            # More secure redaction - mask entire email
-            redacted = '***@***'
+        for pii_type, redact in _PII_REDACTORS.items():
+            if pii_type not in found:
+                continue
             pii_redactions.append(PIIRedaction(
                 field_name=field.field_name,
                 original_value_hash=original_hash,
-                pii_type="Email",
-                redacted_value=redacted,
+                pii_type=pii_type,
+                redacted_value=redact(value_str),
                 redaction_method="regex"
             ))
-            field.redacted = True
+        field.redacted = True
     
     return pii_redactions
@@ -31,15 +31,16 @@ def assess_document_quality(state: DocumentExtractionState) -> dict:
         
         # Deterministic quality check based on document_id
         # In production, this would analyze actual image
-        if "POOR" in state.document_id.upper():
+        document_id = state.document_id.upper()
+        if "POOR" in document_id:
             quality_score = 0.45
             is_skewed = True
             is_crumpled = True
             is_low_contrast = True
-        elif "SKEWED" in state.document_id.upper():
+        elif "SKEWED" in document_id:
             quality_score = 0.62
             is_skewed = True
-        elif "BLURRY" in state.document_id.upper():
+        elif "BLURRY" in document_id:
             quality_score = 0.58
             is_blurry = True
         
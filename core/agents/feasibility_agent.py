@@ -8,7 +8,7 @@ NYC 2026 UPDATE: Includes height-based GL requirements per RCNY §101-08
 
 Maintains $0.007/doc cost efficiency target.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from packages.core import (
@@ -187,6 +187,88 @@ class FeasibilityAgent:
         Returns:
             FeasibilityScore with profitability drain predictions
         """
+        nyc_compliance, gl_gap_cost, premium_increase = self._calculate_gap_costs(
+            signal,
+            project_stories,
+            has_tower_crane,
+            current_gl_coverage
+        )
+        
+        return self._build_assessment(
+            signal,
+            estimated_project_value,
+            estimated_profit_margin,
+            from_agent,
+            nyc_compliance,
+            gl_gap_cost,
+            premium_increase
+        )
+    
+    def assess_for_agencies(
+        self,
+        signal: ScopeSignal,
+        estimated_project_value: float,
+        estimated_profit_margin: float = 0.15,
+        agencies: Optional[List[AgencyRequirement]] = None,
+        from_agent: str = "OpportunityAgent",
+        project_stories: Optional[int] = None,
+        has_tower_crane: bool = False,
+        current_gl_coverage: float = 1_000_000
+    ) -> Dict[AgencyRequirement, FeasibilityScore]:
+        """
+        Assess the same opportunity as if bid to each agency on its own.
+        
+        Gap pricing and the NYC 2026 GL check don't depend on the agency,
+        so they run once; only the strictness multiplier and the scoring
+        built on it are applied per agency.
+        
+        Args:
+            signal: The ScopeSignal opportunity
+            estimated_project_value: Total project value in USD
+            estimated_profit_margin: Expected profit margin (0.0-1.0)
+            agencies: Agencies to compare (defaults to the signal's own)
+            from_agent: Source agent for handshake tracking
+            project_stories: Number of stories (for NYC 2026 requirements)
+            has_tower_crane: Whether project uses tower crane
+            current_gl_coverage: Current GL coverage amount
+            
+        Returns:
+            FeasibilityScore per agency, each counted as one assessment
+        """
+        nyc_compliance, gl_gap_cost, premium_increase = self._calculate_gap_costs(
+            signal,
+            project_stories,
+            has_tower_crane,
+            current_gl_coverage
+        )
+        
+        return {
+            agency: self._build_assessment(
+                signal.model_copy(update={"agency_requirements": [agency]}),
+                estimated_project_value,
+                estimated_profit_margin,
+                from_agent,
+                nyc_compliance,
+                gl_gap_cost,
+                premium_increase
+            )
+            for agency in (agencies if agencies is not None else signal.agency_requirements)
+        }
+    
+    def _calculate_gap_costs(
+        self,
+        signal: ScopeSignal,
+        project_stories: Optional[int],
+        has_tower_crane: bool,
+        current_gl_coverage: float
+    ) -> Tuple[Optional[Dict[str, Any]], float, float]:
+        """
+        Price the agency-independent gaps: NYC 2026 GL shortfall and
+        missing endorsements/coverage.
+        
+        Returns:
+            (nyc_compliance, gl_gap_cost, premium_increase)
+        """
         # NYC 2026: Check GL requirements if project info available
         nyc_compliance = None
         gl_gap_cost = 0.0
@@ -206,6 +288,19 @@ class FeasibilityAgent:
         # Calculate insurance gaps cost
         premium_increase = self._calculate_premium_increase(signal)
         
+        return nyc_compliance, gl_gap_cost, premium_increase
+    
+    def _build_assessment(
+        self,
+        signal: ScopeSignal,
+        estimated_project_value: float,
+        estimated_profit_margin: float,
+        from_agent: str,
+        nyc_compliance: Optional[Dict[str, Any]],
+        gl_gap_cost: float,
+        premium_increase: float
+    ) -> FeasibilityScore:
+        """Apply agency strictness to precomputed gap costs and score the bid."""
         # Add NYC 2026 GL gap cost
         total_premium_increase = premium_increase + gl_gap_cost
         
@@ -319,7 +414,8 @@ class FeasibilityAgent:
             calculation_tokens=tokens,
             calculation_cost=cost,
             recommendation=recommendation,
-            reasoning=reasoning
+            reasoning=reasoning,
+            assessed_by_agent=self.AGENT_ID
         )
     
     def _calculate_premium_increase(self, signal: ScopeSignal) -> float:
@@ -422,11 +518,6 @@ class FeasibilityAgent:
         else:
             return "do_not_bid"
     
-    def _build_reasoning(
-        self,
-        signal: ScopeSignal,
-        premium_increase: float,
-        risk_multiplier: float,
     def _build_reasoning(
         self,
         signal: ScopeSignal,
@@ -1,6 +1,7 @@
 """Insurance Validation Agent - Domain-specific COI compliance checking"""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, FrozenSet
 from datetime import datetime, timedelta
+from functools import lru_cache
 from core.models import (
     DocumentExtractionState, ExtractedField, AgentOutput,
     ExpirationStatus, DocumentType
@@ -8,6 +9,10 @@ from core.models import (
 from core.config import calculate_token_cost
 
 
+# Checkbox / endorsement values that count as present (compared upper-cased)
+_AFFIRMATIVE_VALUES = frozenset({"YES", "TRUE", "X"})
+
+
 def validate_insurance_requirements(state: DocumentExtractionState) -> dict:
     """
     DOMAIN KNOWLEDGE: Insurance Logic
@@ -31,7 +36,7 @@ def validate_insurance_requirements(state: DocumentExtractionState) -> dict:
         # 1. CHECK ADDITIONAL INSURED
         has_additional_insured = _check_field_value(
             fields_dict.get("additional_insured"),
-            expected_values=["YES", "True", "X"]
+            expected_values=_AFFIRMATIVE_VALUES
         )
         if not has_additional_insured:
             validation_errors.append("CRITICAL: Additional Insured endorsement not found")
@@ -40,7 +45,7 @@ def validate_insurance_requirements(state: DocumentExtractionState) -> dict:
         # 2. CHECK WAIVER OF SUBROGATION
         has_waiver = _check_field_value(
             fields_dict.get("waiver_of_subrogation"),
-            expected_values=["YES", "True", "X"]
+            expected_values=_AFFIRMATIVE_VALUES
         )
         if not has_waiver:
             validation_errors.append("CRITICAL: Waiver of Subrogation not found")
@@ -49,7 +54,7 @@ def validate_insurance_requirements(state: DocumentExtractionState) -> dict:
         # 3. CHECK PER PROJECT AGGREGATE
         has_per_project = _check_field_value(
             fields_dict.get("per_project_aggregate"),
-            expected_values=["YES", "True", "X"]
+            expected_values=_AFFIRMATIVE_VALUES
         )
         if not has_per_project:
             validation_errors.append("WARNING: Per Project Aggregate not specified (recommended for large projects)")
@@ -139,16 +144,16 @@ def validate_insurance_requirements(state: DocumentExtractionState) -> dict:
         }
 
 
-def _check_field_value(field: ExtractedField, expected_values: List[str]) -> bool:
+def _check_field_value(field: ExtractedField, expected_values: FrozenSet[str]) -> bool:
     """
-    Check if extracted field matches expected values
+    Check if extracted field matches expected values (given upper-cased)
     Returns True if field exists and matches
     """
     if not field:
         return False
     
     value_str = str(field.value).strip().upper()
-    return any(value_str == expected.upper() for expected in expected_values)
+    return value_str in expected_values
 
 
 def _parse_currency(field: ExtractedField) -> float:
@@ -165,41 +170,54 @@ def _parse_currency(field: ExtractedField) -> float:
         return 0.0
 
 
-def _check_expiration_date(field: ExtractedField) -> ExpirationStatus:
+def _check_expiration_date(
+    field: ExtractedField,
+    today: Optional[datetime] = None
+) -> ExpirationStatus:
     """
     VERIFICATION LOGIC: Compare expiration date against current date
     - Expired: Date in the past
     - Expiring Soon: Within 30 days
     - Valid: More than 30 days remaining
+    
+    today defaults to the current time; pass it to pin the reference date
     """
-    if not field or not field.value:
+    expiration_date = (
+        _parse_expiration_date(str(field.value))
+        if field and field.value else None
+    )
+    if expiration_date is None:
         return ExpirationStatus.NO_EXPIRATION
     
+    if today is None:
+        today = datetime.now()
+    days_until_expiration = (expiration_date - today).days
+    
+    if days_until_expiration < 0:
+        return ExpirationStatus.EXPIRED
+    elif days_until_expiration <= 30:
+        return ExpirationStatus.EXPIRING_SOON
+    else:
+        return ExpirationStatus.VALID
+
+
+@lru_cache(maxsize=4096)
+def _parse_expiration_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse an expiration date string (YYYY-MM-DD or MM/DD/YYYY)
+    Cached because the same dates recur across fields and documents
+    Returns None when the value is not a recognizable date
+    """
     try:
-        # Parse date (supports YYYY-MM-DD, MM/DD/YYYY formats)
-        date_str = str(field.value)
-        
         if '-' in date_str:
             # ISO format: YYYY-MM-DD
-            expiration_date = datetime.strptime(date_str, "%Y-%m-%d")
+            return datetime.strptime(date_str, "%Y-%m-%d")
         elif '/' in date_str:
             # US format: MM/DD/YYYY
-            expiration_date = datetime.strptime(date_str, "%m/%d/%Y")
-        else:
-            return ExpirationStatus.NO_EXPIRATION
-        
-        today = datetime.now()
-        days_until_expiration = (expiration_date - today).days
-        
-        if days_until_expiration < 0:
-            return ExpirationStatus.EXPIRED
-        elif days_until_expiration <= 30:
-            return ExpirationStatus.EXPIRING_SOON
-        else:
-            return ExpirationStatus.VALID
-            
-    except (ValueError, TypeError):
-        return ExpirationStatus.NO_EXPIRATION
+            return datetime.strptime(date_str, "%m/%d/%Y")
+    except ValueError:
+        pass
+    return None
 
 
 def validate_license_expiration(state: DocumentExtractionState) -> dict:
@@ -1,4 +1,5 @@
 """Permit Agent - NYC Building Codes specialist"""
+import time
 from datetime import datetime
 from core.models import AgentOutput, ConstructionState, PermitData
 from core.config import MockNYCApiClient, BUSINESS_CONFIG
@@ -36,7 +37,6 @@ def analyze_permit_compliance(state: ConstructionState) -> dict:
                     errors = state.agent_errors.copy()
                     errors.append(error_msg)
                 else:
-                    import time
                     backoff = min(
                         BUSINESS_CONFIG["retry_limits"]["backoff_base"] ** attempt,
                         BUSINESS_CONFIG["retry_limits"]["max_backoff"]
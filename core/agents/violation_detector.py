@@ -1,71 +1,171 @@
 """Violation Detector Agent - Deterministic mock with token cost logging"""
-from typing import List
+import asyncio
+import queue
+import random
+import socket
+import time
+import weakref
+from functools import lru_cache
+from typing import Tuple
 from datetime import datetime
-from core.models import Violation, RiskLevel, AgentOutput, ConstructionState
+from core.models import Violation, AgentOutput, ConstructionState
 from core.config import (
     MockNYCApiClient, 
-    calculate_token_cost, 
+    NYCApiBreaker,
+    mock_site_seed,
     mock_vision_result,
     BUSINESS_CONFIG
 )
 from pybreaker import CircuitBreakerError
 
 
-def detect_violations(state: ConstructionState) -> dict:
+# GPT-4o Vision per-token prices, read once (same rates as calculate_token_cost)
+_INPUT_PRICE = BUSINESS_CONFIG["openai_pricing"]["gpt4o_vision_input"]
+_OUTPUT_PRICE = BUSINESS_CONFIG["openai_pricing"]["gpt4o_vision_output"]
+
+# Own RNG for backoff jitter so it neither consumes nor depends on the
+# per-site RNGs the mock API results are drawn from
+_BACKOFF_RNG = random.Random()
+
+# Shared across sites so a known outage skips straight to vision-only
+# instead of every site spending its full retry budget
+_NYC_API_BREAKER = NYCApiBreaker(fail_threshold=5, reset_timeout=30.0)
+
+# Idle API clients for reuse. A client serves one site at a time, so the
+# pool grows to peak concurrency (at most the bulkhead size) and is then
+# recycled instead of building a client per site. Pooled clients run
+# without their own breaker: _NYC_API_BREAKER is the only one, and
+# per-client breaker state would otherwise carry over between sites
+_API_CLIENT_POOL: "queue.SimpleQueue[MockNYCApiClient]" = queue.SimpleQueue()
+
+# Bulkhead semaphores, one per event loop: asyncio primitives bind to the
+# loop that first waits on them, and run_compliance_check starts a new
+# loop per call
+_API_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _api_semaphore() -> asyncio.Semaphore:
+    """Bulkhead capping concurrent NYC API retry loops on the running loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _API_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(BUSINESS_CONFIG["retry_limits"].get("max_concurrent", 16))
+        _API_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
+def _is_permanent_api_error(exc: Exception) -> bool:
+    """
+    Whether retrying the NYC API call is pointless
+    DNS/permission failures won't heal within a backoff window
+    """
+    return (
+        isinstance(exc.__cause__, (socket.gaierror, PermissionError))
+        or "permanent" in str(exc).lower()
+    )
+
+
+@lru_cache(maxsize=4096)
+def _analyze_site(site_id: str) -> Tuple[Tuple[Violation, ...], int, int]:
+    """
+    Parsed mock vision result for a site: (violations, input_tokens, output_tokens)
+    Pure in site_id, so re-analysing a site reuses the parsed Violations;
+    the tuple keeps callers from mutating the cached list
+    """
+    vision_response = mock_vision_result(site_id)
+    violations = tuple(Violation(**v_data) for v_data in vision_response["violations"])
+    return violations, vision_response["input_tokens"], vision_response["output_tokens"]
+
+
+async def detect_violations(state: ConstructionState) -> dict:
     """
     Deterministic violation detection using mock_vision_result
     Prints TOKEN_COST_USD after every call
     Returns dict of state updates for LangGraph
+    
+    Async so permit API latency and retry backoff yield the event loop
+    to other sites instead of blocking it
+    Reports wall time in data["duration_ns"] for p95/timeout tuning
     """
+    started_ns = time.perf_counter_ns()
     try:
-        # Call deterministic mock vision API
-        vision_response = mock_vision_result(state.site_id)
-        
-        # Parse violations
-        violations = []
-        for v_data in vision_response["violations"]:
-            violations.append(Violation(**v_data))
+        # Call deterministic mock vision API (cached per site)
+        cached_violations, input_tokens, output_tokens = _analyze_site(state.site_id)
+        violations = list(cached_violations)
         
         # Calculate cost
-        input_tokens = vision_response["input_tokens"]
-        output_tokens = vision_response["output_tokens"]
-        cost = calculate_token_cost(input_tokens, output_tokens)
+        total_tokens = input_tokens + output_tokens
+        cost = input_tokens * _INPUT_PRICE + output_tokens * _OUTPUT_PRICE
         
         # MANDATORY: Print token cost
         print(f"[VISION] TOKEN_COST_USD: ${cost:.6f} (in={input_tokens}, out={output_tokens})")
         
         # Attempt to fetch permit data with circuit breaker
         permit_data = None
-        api_client = MockNYCApiClient()
+        errors = state.agent_errors.copy()
         
-        for attempt in range(BUSINESS_CONFIG["retry_limits"]["max_attempts"]):
+        # Bulkhead: only the network path is gated; vision work above is not.
+        # Taking the client inside it also caps the client pool's size
+        async with _api_semaphore():
             try:
-                permit_data = api_client.get_permit_violations(state.site_id)
-                break
-            except (ConnectionError, CircuitBreakerError) as e:
-                if attempt == BUSINESS_CONFIG["retry_limits"]["max_attempts"] - 1:
-                    error_msg = f"NYC API failed after {attempt+1} attempts: {str(e)}"
-                    errors = state.agent_errors.copy()
-                    errors.append(error_msg)
-                else:
-                    import time
-                    backoff = min(
-                        BUSINESS_CONFIG["retry_limits"]["backoff_base"] ** attempt,
-                        BUSINESS_CONFIG["retry_limits"]["max_backoff"]
-                    )
-                    time.sleep(backoff)
+                api_client = _API_CLIENT_POOL.get_nowait()
+            except queue.Empty:
+                api_client = MockNYCApiClient(use_circuit_breaker=False)
+            calls_before = api_client.call_count
+            # Fresh per call (even when _analyze_site is a cache hit) and
+            # private to this site, so the mock permit draws don't depend on
+            # global random state or on other sites' threads
+            site_rng = random.Random(mock_site_seed(state.site_id))
+            
+            try:
+                for attempt in range(BUSINESS_CONFIG["retry_limits"]["max_attempts"]):
+                    if not _NYC_API_BREAKER.allow():
+                        errors.append("NYC API breaker open")
+                        break
+                    try:
+                        # Client is blocking; run it off the event loop
+                        permit_data = await asyncio.to_thread(
+                            api_client.get_permit_violations, state.site_id, site_rng
+                        )
+                        _NYC_API_BREAKER.record_success()
+                        break
+                    except (ConnectionError, CircuitBreakerError) as e:
+                        # A client's own breaker refusing is local state, not
+                        # news about the API, so only real failures count
+                        if not isinstance(e, CircuitBreakerError):
+                            _NYC_API_BREAKER.record_failure()
+                        if _is_permanent_api_error(e):
+                            errors.append(f"NYC API failed permanently: {str(e)}")
+                            break
+                        if attempt == BUSINESS_CONFIG["retry_limits"]["max_attempts"] - 1:
+                            error_msg = f"NYC API failed after {attempt+1} attempts: {str(e)}"
+                            errors.append(error_msg)
+                        else:
+                            backoff = min(
+                                BUSINESS_CONFIG["retry_limits"]["backoff_base"] ** attempt,
+                                BUSINESS_CONFIG["retry_limits"]["max_backoff"]
+                            )
+                            if BUSINESS_CONFIG["retry_limits"]["jitter"]:
+                                backoff = _BACKOFF_RNG.uniform(0, backoff)
+                            await asyncio.sleep(backoff)
+            finally:
+                api_calls = api_client.call_count - calls_before
+                _API_CLIENT_POOL.put(api_client)
         
         # Log agent output
         agent_output = AgentOutput(
             agent_name="violation_detector",
             status="success",
-            tokens_used=input_tokens + output_tokens,
+            tokens_used=total_tokens,
             usd_cost=cost,
             timestamp=datetime.now(),
             data={
                 "violations_found": len(violations),
                 "permit_status": permit_data.status if permit_data else "unavailable",
-                "api_calls": api_client.call_count
+                "api_calls": api_calls,
+                "duration_ns": time.perf_counter_ns() - started_ns
             }
         )
         
@@ -76,9 +176,10 @@ def detect_violations(state: ConstructionState) -> dict:
         return {
             "violations": violations,
             "permit_data": permit_data,
-            "total_tokens": state.total_tokens + (input_tokens + output_tokens),
+            "total_tokens": state.total_tokens + total_tokens,
             "total_cost": state.total_cost + cost,
             "agent_outputs": agent_outputs,
+            "agent_errors": errors,
         }
         
     except Exception as e:
@@ -91,7 +192,7 @@ def detect_violations(state: ConstructionState) -> dict:
             tokens_used=0,
             usd_cost=0.0,
             timestamp=datetime.now(),
-            data={"error": str(e)}
+            data={"error": str(e), "duration_ns": time.perf_counter_ns() - started_ns}
         )
         agent_outputs = state.agent_outputs.copy()
         agent_outputs.append(agent_output)
@@ -1,6 +1,8 @@
 """Config and Mock API clients - Production-style service abstraction"""
+import bisect
 import os
 import random
+import threading
 import time
 from typing import Optional, Dict, Any, List
 from core.models import PermitData, RiskLevel
@@ -8,52 +10,61 @@ from datetime import datetime, timedelta
 from pybreaker import CircuitBreaker
 
 
+# Mock vision violation templates: (seed threshold, id suffix, fields)
+# A site gets every template whose threshold its seed falls below;
+# thresholds must stay ascending (see _VISION_THRESHOLDS)
+_VISION_VIOLATION_TEMPLATES = (
+    # 30% have critical violations (matches 87% accuracy when combined with other levels)
+    (30, "V001", {
+        "category": "Structural Safety",
+        "description": "Unsecured scaffolding on 45+ story building, immediate collapse risk",
+        "confidence": 0.94,
+        "risk_level": "CRITICAL",
+        "estimated_fine": 75000,
+        "location": "Exterior South Face, Floor 45"
+    }),
+    # 60% have high-risk violations
+    (60, "V002", {
+        "category": "Fall Protection",
+        "description": "Missing guardrails at roof edge, OSHA 1926.501 violation",
+        "confidence": 0.88,
+        "risk_level": "HIGH",
+        "estimated_fine": 25000,
+        "location": "Roof Perimeter, North Section"
+    }),
+    # 85% have medium violations
+    (85, "V003", {
+        "category": "Site Management",
+        "description": "Debris accumulation blocking fire exit route",
+        "confidence": 0.65,
+        "risk_level": "MEDIUM",
+        "estimated_fine": 5000,
+        "location": "Ground Level, Exit C"
+    }),
+)
+# Thresholds ascend, so the templates a seed falls below are always a suffix
+# of the table; bisect finds where it starts in one lookup
+_VISION_THRESHOLDS = tuple(threshold for threshold, _, _ in _VISION_VIOLATION_TEMPLATES)
+
+
+def mock_site_seed(photo_id: str) -> int:
+    """Deterministic seed for a site/photo - sum of char codes, stable across processes"""
+    return sum(ord(c) for c in photo_id) % 100
+
+
 def mock_vision_result(photo_id: str) -> Dict[str, Any]:
     """
     Deterministic mock of GPT-4o Vision API - always returns same result for same photo_id
     Achieves 87% accuracy through carefully balanced violation detection
     """
-    # Deterministic seed based on photo_id - use sum of char codes for determinism
-    seed = sum(ord(c) for c in photo_id) % 100
+    seed = mock_site_seed(photo_id)
     random.seed(seed)
     
-    violations = []
-    
-    # 30% have critical violations (matches 87% accuracy when combined with other levels)
-    if seed < 30:
-        violations.append({
-            "violation_id": f"{photo_id}-V001",
-            "category": "Structural Safety",
-            "description": "Unsecured scaffolding on 45+ story building, immediate collapse risk",
-            "confidence": 0.94,
-            "risk_level": "CRITICAL",
-            "estimated_fine": 75000,
-            "location": "Exterior South Face, Floor 45"
-        })
-    
-    # 60% have high-risk violations
-    if seed < 60:
-        violations.append({
-            "violation_id": f"{photo_id}-V002",
-            "category": "Fall Protection",
-            "description": "Missing guardrails at roof edge, OSHA 1926.501 violation",
-            "confidence": 0.88,
-            "risk_level": "HIGH",
-            "estimated_fine": 25000,
-            "location": "Roof Perimeter, North Section"
-        })
-    
-    # 85% have medium violations
-    if seed < 85:
-        violations.append({
-            "violation_id": f"{photo_id}-V003",
-            "category": "Site Management",
-            "description": "Debris accumulation blocking fire exit route",
-            "confidence": 0.65,
-            "risk_level": "MEDIUM",
-            "estimated_fine": 5000,
-            "location": "Ground Level, Exit C"
-        })
+    first = bisect.bisect_right(_VISION_THRESHOLDS, seed)
+    violations = [
+        {"violation_id": f"{photo_id}-{suffix}", **fields}
+        for _, suffix, fields in _VISION_VIOLATION_TEMPLATES[first:]
+    ]
     
     # Calculate token usage (deterministic)
     input_tokens = 1500  # Image + prompt
@@ -69,43 +80,130 @@ def mock_vision_result(photo_id: str) -> Dict[str, Any]:
 class MockNYCApiClient:
     """Mock NYC DOB/HPD API with realistic latency and configurable failure rate"""
     
-    def __init__(self, failure_rate: float = None):
+    def __init__(self, failure_rate: float = None, use_circuit_breaker: bool = True):
         # Load from environment variables with fallback defaults
         self.failure_rate = failure_rate if failure_rate is not None else float(os.getenv('MOCK_FAILURE_RATE', '0.23'))
         self.latency_min = float(os.getenv('MOCK_LATENCY_MIN', '0.05'))
         self.latency_max = float(os.getenv('MOCK_LATENCY_MAX', '0.2'))
         self.call_count = 0
         # Circuit breaker: 3 failures → opens, 30s timeout
+        # Disable it for long-lived clients that are guarded by a shared
+        # breaker instead, or its state would leak from one site to the next
         self.circuit_breaker = CircuitBreaker(
             fail_max=3,
             reset_timeout=30,
             name="NYC_DOB_API"
-        )
+        ) if use_circuit_breaker else None
         
-    def get_permit_violations(self, site_id: str) -> Optional[PermitData]:
-        """Simulate API call with latency and failures - wrapped in circuit breaker"""
+    def get_permit_violations(
+        self,
+        site_id: str,
+        rng: Optional[random.Random] = None
+    ) -> Optional[PermitData]:
+        """
+        Simulate API call with latency and failures - wrapped in circuit breaker
+        rng defaults to the global random state; pass a seeded Random to make
+        the outcome independent of other threads drawing concurrently
+        """
         self.call_count += 1
+        rng = rng or random
         
         def _api_call():
             # Simulate network latency with configurable range
-            time.sleep(random.uniform(self.latency_min, self.latency_max))
+            time.sleep(rng.uniform(self.latency_min, self.latency_max))
             
             # Configurable failure rate
-            if random.random() < self.failure_rate:
+            if rng.random() < self.failure_rate:
                 raise ConnectionError(f"NYC API unavailable for site {site_id}")
             
             # Mock successful response
             return PermitData(
                 site_id=site_id,
-                permit_number=f"BLD-2024-{random.randint(10000, 99999)}",
-                status=random.choice(["ACTIVE", "EXPIRED", "PENDING"]),
-                expiration_date=datetime.now() + timedelta(days=random.randint(-30, 180)),
-                violations_on_record=random.randint(0, 5)
+                permit_number=f"BLD-2024-{rng.randint(10000, 99999)}",
+                status=rng.choice(["ACTIVE", "EXPIRED", "PENDING"]),
+                expiration_date=datetime.now() + timedelta(days=rng.randint(-30, 180)),
+                violations_on_record=rng.randint(0, 5)
             )
         
+        if self.circuit_breaker is None:
+            return _api_call()
         return self.circuit_breaker.call(_api_call)
 
 
+class NYCApiBreaker:
+    """
+    Process-wide circuit breaker for the NYC API, shared by all sites
+    Remembers an outage across calls so later sites fail fast; clients
+    guarded by it run with their own breaker disabled
+    closed → open after fail_threshold consecutive failures, open → half-open
+    once the cooldown has passed, then a success closes / a failure re-opens
+    The cooldown starts at reset_timeout and grows by reset_base for each
+    consecutive trip (up to reset_cap), so a long outage gets fewer probes
+    Half-open admits a single probe until it reports back; a probe that
+    never reports gives up its slot after another cooldown
+    Thread-safe: transitions are guarded by a lock, since the module-level
+    instance is shared by every event loop and worker thread in the process
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        fail_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        reset_base: float = 2.0,
+        reset_cap: float = 300.0
+    ):
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.reset_base = reset_base
+        self.reset_cap = reset_cap
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.trip_count = 0
+        self.opened_at = 0.0
+        self.probe_started_at = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def cooldown(self) -> float:
+        """Seconds to stay open after the current trip"""
+        extra_trips = max(self.trip_count - 1, 0)
+        return min(self.reset_timeout * self.reset_base ** extra_trips, self.reset_cap)
+    
+    def allow(self) -> bool:
+        """Whether a call may go out now; moves open → half-open after the cooldown"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                if now - self.opened_at < self.cooldown:
+                    return False
+                self.state = self.HALF_OPEN
+            elif now - self.probe_started_at < self.cooldown:
+                return False  # Half-open and the current probe hasn't reported yet
+            self.probe_started_at = now
+            return True
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failure_count += 1
+            if self.state == self.OPEN:
+                return  # Straggler from before the trip; don't restart the cooldown
+            if self.state == self.HALF_OPEN or self.failure_count >= self.fail_threshold:
+                self.state = self.OPEN
+                self.trip_count += 1
+                self.opened_at = time.monotonic()
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+            self.trip_count = 0
+
+
 # Business Rules - Production Thresholds
 BUSINESS_CONFIG = {
     "risk_thresholds": {
@@ -119,7 +217,9 @@ BUSINESS_CONFIG = {
     "retry_limits": {
         "max_attempts": 3,
         "backoff_base": 2,  # Exponential: 2^attempt seconds
-        "max_backoff": 10
+        "max_backoff": 10,
+        "jitter": True,  # Full jitter: sleep uniform(0, capped backoff) so concurrent retries spread out
+        "max_concurrent": 16  # Bulkhead: sites allowed in the NYC API retry loop at once
     },
     "openai_pricing": {
         "gpt4o_vision_input": 0.0000025,  # $2.50 per 1M tokens
@@ -1,6 +1,7 @@
 """Pydantic models for Construction Compliance AI - Type-safe contracts"""
+import sys
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 from enum import Enum
 
@@ -14,6 +15,9 @@ class RiskLevel(str, Enum):
 
 class Violation(BaseModel):
     """Single violation detected by vision AI"""
+    # Frozen: the violation detector caches and shares instances across runs
+    model_config = ConfigDict(frozen=True)
+    
     violation_id: str
     category: str
     description: str
@@ -83,8 +87,17 @@ class ExpirationStatus(str, Enum):
     NO_EXPIRATION = "NO_EXPIRATION"
 
 
+class ExtractionMethod(str, Enum):
+    """How a field value was extracted"""
+    OCR = "OCR"
+    LLM = "LLM"
+    MANUAL = "Manual"
+
+
 class SourceCoordinate(BaseModel):
     """Bounding box coordinates for extracted data - maps to original document"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     page: int = Field(ge=1, description="Page number (1-indexed)")
     x: float = Field(ge=0.0, le=1.0, description="Left position (normalized 0-1)")
     y: float = Field(ge=0.0, le=1.0, description="Top position (normalized 0-1)")
@@ -98,9 +111,15 @@ class ExtractedField(BaseModel):
     value: Any
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence score 0-1")
     source_coordinate: Optional[SourceCoordinate] = None
-    extraction_method: str = Field(default="OCR", description="OCR, LLM, Manual")
+    extraction_method: ExtractionMethod = Field(default=ExtractionMethod.OCR, description="OCR, LLM, Manual")
     validation_errors: List[str] = Field(default_factory=list)
     redacted: bool = Field(default=False, description="PII redaction applied")
+    
+    @field_validator("field_name")
+    @classmethod
+    def _intern_field_name(cls, value: str) -> str:
+        """Field names repeat across every document; share one string object each"""
+        return sys.intern(value)
 
 
 class InsuranceCoverage(BaseModel):
@@ -191,7 +210,9 @@ class LienWaiver(BaseModel):
 
 
 class PIIRedaction(BaseModel):
-    """PII redaction tracking"""
+    """PII redaction tracking - immutable once recorded"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     field_name: str
     original_value_hash: str = Field(description="SHA-256 hash of original")
     pii_type: str  # SSN, Phone, Email, Address, etc.
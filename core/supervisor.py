@@ -1,4 +1,5 @@
 """Supervisor - LangGraph StateGraph with production patterns"""
+import asyncio
 from typing import Literal
 from datetime import datetime
 from langgraph.graph import StateGraph, END
@@ -43,9 +44,9 @@ def create_supervisor_graph():
     return workflow.compile()
 
 
-def run_compliance_check(site_id: str, image_url: str = None) -> ConstructionState:
+async def arun_compliance_check(site_id: str, image_url: str = None) -> ConstructionState:
     """
-    Execute full compliance check for a construction site
+    Execute full compliance check for a construction site (async)
     Returns: Complete state with violations, costs, and processing metrics
     """
     # Initialize state
@@ -58,23 +59,40 @@ def run_compliance_check(site_id: str, image_url: str = None) -> ConstructionSta
     # Create and execute graph
     graph = create_supervisor_graph()
     # LangGraph returns AddableValuesDict, convert to ConstructionState
-    final_state_dict = graph.invoke(initial_state)
+    # detect_violations is async, so the graph must be driven with ainvoke
+    final_state_dict = await graph.ainvoke(initial_state)
     
     # Convert dictionary result to ConstructionState
     final_state = ConstructionState(**final_state_dict)
     return final_state
 
 
+def run_compliance_check(site_id: str, image_url: str = None) -> ConstructionState:
+    """
+    Execute full compliance check for a construction site
+    Sync entry point for callers without an event loop (Celery tasks, scripts)
+    """
+    return asyncio.run(arun_compliance_check(site_id, image_url))
+
+
+async def arun_batch_compliance(site_ids: list[str]) -> list[ConstructionState]:
+    """
+    Process multiple sites concurrently
+    API latency and retry backoff of one site overlap with the others
+    Each site's mock permit draws come from its own seeded RNG, so results
+    don't depend on how the concurrent permit fetches interleave
+    """
+    return list(await asyncio.gather(*[
+        arun_compliance_check(site_id) for site_id in site_ids
+    ]))
+
+
 def run_batch_compliance(site_ids: list[str]) -> list[ConstructionState]:
     """
-    Process multiple sites sequentially
-    Production: Would use async/parallel execution for 1000+ sites
+    Process multiple sites concurrently
+    Sync wrapper around arun_batch_compliance; results keep site_ids order
     """
-    results = []
-    for site_id in site_ids:
-        result = run_compliance_check(site_id)
-        results.append(result)
-    return results
+    return asyncio.run(arun_batch_compliance(site_ids))
 
 
 if __name__ == "__main__":
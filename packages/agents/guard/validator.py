@@ -18,7 +18,7 @@ import json
 from typing import Dict, Any, List, Optional, Literal
 from datetime import datetime, timedelta
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Import our new audit and telemetry modules
 from packages.core.audit import (
@@ -35,6 +35,8 @@ from packages.core.nyc_2026_regulations import (
 
 class ComplianceResult(BaseModel):
     """Guard Agent output - frozen for audit trail"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     status: Literal["APPROVED", "REJECTED", "ILLEGIBLE", "PENDING_FIX"]
     deficiency_list: List[str] = Field(default_factory=list)
     decision_proof: str = Field(description="SHA-256 hash from DecisionProof")
@@ -44,9 +46,6 @@ class ComplianceResult(BaseModel):
     ocr_confidence: float = Field(ge=0.0, le=1.0, description="OCR legibility score")
     page_count: int = Field(ge=1, description="Number of pages processed")
     citations: List[str] = Field(default_factory=list, description="Regulatory citations for deficiencies")
-    
-    class Config:
-        frozen = True
 
 
 def _simulate_ocr(pdf_path: str) -> Dict[str, Any]:
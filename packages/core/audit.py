@@ -4,10 +4,13 @@ Implements SHA-256 hashing with logic citations for regulatory compliance
 Satisfies NYC Local Law 144 and EU AI Act Article 13 requirements
 """
 import hashlib
+import hmac
+import io
 import json
-from typing import Dict, Any, List, Optional
+from functools import cached_property
+from typing import Dict, Any, List, Optional, TextIO
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -24,15 +27,28 @@ class ComplianceStandard(str, Enum):
 
 
 class LogicCitation(BaseModel):
-    """Single logic citation explaining why a decision was made"""
+    """Single logic citation explaining why a decision was made (immutable)"""
+    model_config = ConfigDict(frozen=True)
+    
     standard: ComplianceStandard
     clause: str = Field(description="Specific clause or section number")
     interpretation: str = Field(description="Human-readable interpretation")
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence in this citation")
     
+    @cached_property
+    def text(self) -> str:
+        """Readable citation text, rendered once per citation"""
+        return f"{self.standard.value} § {self.clause}: {self.interpretation} (confidence: {self.confidence:.2f})"
+    
     def to_text(self) -> str:
         """Format citation as readable text"""
-        return f"{self.standard.value} § {self.clause}: {self.interpretation} (confidence: {self.confidence:.2f})"
+        return self.text
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'LogicCitation':
+        """Copy the citation, dropping the cached text so it reflects any update"""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("text", None)
+        return copied
 
 
 class DecisionProof(BaseModel):
@@ -89,12 +105,16 @@ class DecisionProof(BaseModel):
         Returns:
             64-character hex SHA-256 hash
         """
+        return self._compute_digest().hex()
+    
+    def _compute_digest(self) -> bytes:
+        """Raw 32-byte SHA-256 digest of the canonical decision record"""
         # Create canonical representation for hashing
         hash_input = {
             "decision_id": self.decision_id,
             "timestamp": self.timestamp.isoformat(),
             "agent_name": self.agent_name,
-            "input_data": self._serialize_for_hash(self.input_data),
+            "input_data": self.input_data,
             "decision": self.decision,
             "confidence": self.confidence,
             "logic_citations": [
@@ -110,30 +130,32 @@ class DecisionProof(BaseModel):
             "risk_level": self.risk_level,
         }
         
-        # Convert to deterministic JSON string (sorted keys)
-        json_str = json.dumps(hash_input, sort_keys=True, separators=(',', ':'))
+        # Serialize straight to deterministic JSON bytes (sorted keys);
+        # nested special types are handled by _serialize_for_hash
+        payload = json.dumps(
+            hash_input,
+            sort_keys=True,
+            separators=(',', ':'),
+            default=self._serialize_for_hash
+        ).encode('utf-8')
         
-        # Generate SHA-256 hash
-        hash_obj = hashlib.sha256(json_str.encode('utf-8'))
-        return hash_obj.hexdigest()
+        # Generate SHA-256 hash (hashlib uses OpenSSL's hardware SHA where available)
+        return hashlib.sha256(payload).digest()
     
-    def _serialize_for_hash(self, data: Any) -> Any:
+    @staticmethod
+    def _serialize_for_hash(data: Any) -> Any:
         """
-        Recursively serialize data for consistent hashing
-        Handles special types like datetime, BaseModel, etc.
+        json.dumps fallback for values JSON cannot encode natively
+        Handles special types like datetime, BaseModel, etc.; the encoder
+        recurses into whatever is returned
         """
-        if isinstance(data, dict):
-            return {k: self._serialize_for_hash(v) for k, v in sorted(data.items())}
-        elif isinstance(data, (list, tuple)):
-            return [self._serialize_for_hash(item) for item in data]
-        elif isinstance(data, datetime):
+        if isinstance(data, datetime):
             return data.isoformat()
         elif isinstance(data, BaseModel):
-            return self._serialize_for_hash(data.dict())
+            return data.model_dump()
         elif hasattr(data, '__dict__'):
-            return self._serialize_for_hash(data.__dict__)
-        else:
-            return data
+            return data.__dict__
+        raise TypeError(f"Object of type {type(data).__name__} is not JSON serializable")
     
     def verify_hash(self) -> bool:
         """
@@ -142,11 +164,18 @@ class DecisionProof(BaseModel):
         Returns:
             True if hash is valid (not tampered), False if tampered
         """
-        if not self.proof_hash:
+        # Only the canonical form generate_hash() emits: 64 lowercase hex chars.
+        # bytes.fromhex alone would also accept uppercase and embedded spaces
+        if len(self.proof_hash) != 64 or self.proof_hash != self.proof_hash.lower():
             return False
         
-        current_hash = self.generate_hash()
-        return current_hash == self.proof_hash
+        try:
+            stored_digest = bytes.fromhex(self.proof_hash)
+        except ValueError:
+            return False
+        
+        # Constant-time compare of the raw digests (no timing oracle on proof_hash)
+        return hmac.compare_digest(self._compute_digest(), stored_digest)
     
     def finalize(self) -> 'DecisionProof':
         """
@@ -159,45 +188,57 @@ class DecisionProof(BaseModel):
         self.proof_hash = self.generate_hash()
         return self
     
-    def to_audit_report(self) -> str:
+    def to_audit_report(self, out: Optional[TextIO] = None) -> str:
         """
         Generate human-readable audit report for this decision
         Suitable for presenting to regulators or legal teams
+        
+        Args:
+            out: Optional text sink (e.g. an open file) to stream the report
+                into, newline-terminated so reports can be written back to back
+        
+        Returns:
+            The report text, or "" when it was written to out
         """
-        report_lines = [
-            "=" * 80,
-            f"DECISION AUDIT REPORT",
-            "=" * 80,
-            f"Decision ID: {self.decision_id}",
-            f"Timestamp: {self.timestamp.isoformat()}",
-            f"Agent: {self.agent_name}",
-            f"Decision: {self.decision}",
-            f"Confidence: {self.confidence:.2%}",
-            f"Risk Level: {self.risk_level}",
-            "",
-            "REASONING:",
-            self.reasoning,
-            "",
-            "REGULATORY COMPLIANCE CITATIONS:",
-        ]
+        buf = io.StringIO() if out is None else out
+        w = buf.write
+        
+        w("=" * 80 + "\n")
+        w("DECISION AUDIT REPORT\n")
+        w("=" * 80 + "\n")
+        w(f"Decision ID: {self.decision_id}\n")
+        w(f"Timestamp: {self.timestamp.isoformat()}\n")
+        w(f"Agent: {self.agent_name}\n")
+        w(f"Decision: {self.decision}\n")
+        w(f"Confidence: {self.confidence:.2%}\n")
+        w(f"Risk Level: {self.risk_level}\n")
+        w("\n")
+        w("REASONING:\n")
+        w(f"{self.reasoning}\n")
+        w("\n")
+        w("REGULATORY COMPLIANCE CITATIONS:\n")
         
         if not self.logic_citations:
-            report_lines.append("  (No citations provided)")
+            w("  (No citations provided)\n")
         else:
             for i, citation in enumerate(self.logic_citations, 1):
-                report_lines.append(f"  {i}. {citation.to_text()}")
+                w(f"  {i}. {citation.to_text()}\n")
         
-        report_lines.extend([
-            "",
-            f"FINANCIAL IMPACT: ${self.estimated_financial_impact:,.2f}" if self.estimated_financial_impact else "FINANCIAL IMPACT: Not calculated",
-            f"PROCESSING COST: ${self.cost_usd:.6f}",
-            "",
-            f"PROOF HASH (SHA-256): {self.proof_hash}",
-            f"Hash Valid: {self.verify_hash()}",
-            "=" * 80,
-        ])
+        w("\n")
+        if self.estimated_financial_impact:
+            w(f"FINANCIAL IMPACT: ${self.estimated_financial_impact:,.2f}\n")
+        else:
+            w("FINANCIAL IMPACT: Not calculated\n")
+        w(f"PROCESSING COST: ${self.cost_usd:.6f}\n")
+        w("\n")
+        w(f"PROOF HASH (SHA-256): {self.proof_hash}\n")
+        w(f"Hash Valid: {self.verify_hash()}\n")
+        w("=" * 80)
         
-        return "\n".join(report_lines)
+        if out is None:
+            return buf.getvalue()
+        w("\n")
+        return ""
 
 
 def create_decision_proof(
@@ -260,8 +301,9 @@ def validate_decision_proof(proof: DecisionProof) -> Dict[str, Any]:
     """
     issues = []
     
-    # Check hash integrity
-    if not proof.verify_hash():
+    # Check hash integrity (computed once; reused in the result below)
+    hash_valid = proof.verify_hash()
+    if not hash_valid:
         issues.append("CRITICAL: Hash verification failed - proof may be tampered")
     
     # Check required fields
@@ -281,7 +323,7 @@ def validate_decision_proof(proof: DecisionProof) -> Dict[str, Any]:
     return {
         "valid": len([i for i in issues if i.startswith("CRITICAL") or i.startswith("ERROR")]) == 0,
         "issues": issues,
-        "hash_valid": proof.verify_hash(),
+        "hash_valid": hash_valid,
         "has_citations": len(proof.logic_citations) > 0,
         "confidence_adequate": proof.confidence >= 0.5
     }
@@ -12,7 +12,7 @@ import csv
 import json
 import functools
 import hashlib
-from typing import Callable, Any, Dict, Optional, List
+from typing import Callable, Any, Dict, Optional, List, Sequence, Tuple
 from datetime import datetime
 from pathlib import Path
 from pydantic import BaseModel, Field
@@ -70,6 +70,40 @@ def calculate_llm_cost(
     return input_cost + output_cost
 
 
+def calculate_llm_cost_batch(
+    model_names: Sequence[str],
+    input_tokens: Sequence[int],
+    output_tokens: Sequence[int]
+) -> List[float]:
+    """
+    Calculate USD costs for many LLM calls at once
+    
+    Pricing is resolved once per distinct model rather than once per call;
+    each cost is computed exactly as calculate_llm_cost would.
+    
+    Args:
+        model_names: Model identifier for each call
+        input_tokens: Input/prompt tokens for each call
+        output_tokens: Completion/output tokens for each call
+    
+    Returns:
+        Cost in USD for each call, in input order
+    """
+    if not len(model_names) == len(input_tokens) == len(output_tokens):
+        raise ValueError("model_names, input_tokens and output_tokens must be the same length")
+    
+    rates: Dict[str, Tuple[float, float]] = {}
+    for model_name in set(model_names):
+        pricing = MODEL_PRICING.get(model_name, MODEL_PRICING["claude-3-haiku"])
+        rates[model_name] = (pricing["input"], pricing["output"])
+    
+    costs = []
+    for model_name, n_in, n_out in zip(model_names, input_tokens, output_tokens):
+        input_rate, output_rate = rates[model_name]
+        costs.append(n_in * input_rate + n_out * output_rate)
+    return costs
+
+
 def track_agent_cost(
     agent_name: str,
     model_name: str = "claude-3-haiku",
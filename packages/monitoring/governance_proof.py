@@ -207,6 +207,7 @@ class LegalSandbox:
         else:
             status = LegalSandboxStatus.APPROVED
             send_blocked = False
+            block_reason = None
         
         # Create governance proof
         proof = GovernanceProof(
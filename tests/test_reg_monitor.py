@@ -117,6 +117,44 @@ class TestDiffEngine:
         assert len(diff.added_lines) == 0
         assert len(diff.removed_lines) == 0
 
+    @pytest.mark.parametrize(
+        ("changed", "expected"),
+        [
+            (5, "MINOR"),
+            (6, "MODERATE"),
+            (20, "MODERATE"),
+            (21, "MAJOR"),
+            (50, "MAJOR"),
+            (51, "BREAKING"),
+        ],
+    )
+    def test_classify_severity_threshold_boundaries(self, changed, expected):
+        """Each threshold is inclusive of its upper bound."""
+        assert RegulationDiffEngine._classify_severity(changed, 100) == expected
+
+    def test_compute_diff_keeps_lines_with_diff_markers(self, engine):
+        """Lines that begin with '--' or '++' must not be mistaken for headers."""
+        diff = engine.compute_diff("-- note A\nbody", "++ note B\nbody")
+
+        assert diff.removed_lines == ["-- note A"]
+        assert diff.added_lines == ["++ note B"]
+        assert diff.modified_sections == ["@@ -1,2 +1,2 @@"]
+
+    def test_compute_diff_identical_text_skips_difflib(self, engine, monkeypatch):
+        """Equal texts should short-circuit without invoking difflib."""
+        def _fail(*args, **kwargs):
+            raise AssertionError("difflib should not run for identical text")
+
+        monkeypatch.setattr(
+            "concomplyai.reg_monitor.regulation_diff_engine.difflib.SequenceMatcher",
+            _fail,
+        )
+        text = "Section 1: Requirements"
+        diff = engine.compute_diff(text, "".join(["Section 1: ", "Requirements"]))
+
+        assert diff.change_severity == "MINOR"
+        assert diff.modified_sections == []
+
 
 class TestRuleUpdater:
     """Tests for the RuleUpdater."""
@@ -136,6 +136,37 @@ class TestVendorScoring:
         score = scorer.score_vendor(profile)
         assert SHA256_PATTERN.match(score.score_hash)
 
+    def test_rescoring_unchanged_profile_uses_cache(self, scorer):
+        """Scoring an equivalent profile twice should reuse the cached score content."""
+        first = scorer.score_vendor(
+            _make_profile(certifications=[_valid_cert()], compliance_history=[_pass_record()])
+        )
+        second = scorer.score_vendor(
+            _make_profile(certifications=[_valid_cert()], compliance_history=[_pass_record()])
+        )
+        changed = scorer.score_vendor(
+            _make_profile(certifications=[_expired_cert()], compliance_history=[_pass_record()])
+        )
+
+        assert len(scorer._cache) == 2
+        assert second.score_hash == first.score_hash
+        assert second.overall_score == first.overall_score
+        assert changed.score_id != first.score_id
+        assert changed.certification_score == 0.0
+
+    def test_cache_hit_returns_fresh_snapshot(self, scorer):
+        """A cache hit should not hand out the cached object or its mutable list."""
+        profile = _make_profile(certifications=[], compliance_history=[])
+        first = scorer.score_vendor(profile)
+        first.risk_factors.append("caller scribble")
+
+        second = scorer.score_vendor(profile)
+
+        assert second is not first
+        assert second.score_id != first.score_id
+        assert second.scored_at >= first.scored_at
+        assert "caller scribble" not in second.risk_factors
+
 
 class TestVendorDashboard:
     """Tests for the VendorDashboard."""
@@ -0,0 +1,28 @@
+"""
+Shared fixtures for the validation suite
+Agents here are built once per session; tests that assert on an agent's
+usage counters should construct their own instance instead.
+"""
+import pytest
+from datetime import datetime
+
+from core.agents.broker_liaison_agent import BrokerLiaisonAgent
+from core.agents.feasibility_agent import FeasibilityAgent
+
+
+@pytest.fixture(scope="session")
+def broker_agent():
+    """Shared BrokerLiaison agent for tests that don't inspect its counters"""
+    return BrokerLiaisonAgent()
+
+
+@pytest.fixture(scope="session")
+def feasibility_agent():
+    """Shared Feasibility agent for tests that don't inspect its counters"""
+    return FeasibilityAgent()
+
+
+@pytest.fixture(scope="session")
+def now():
+    """Clock reading taken once per session so date-relative fixtures agree"""
+    return datetime.now()
@@ -2,12 +2,12 @@
 Tests for BrokerLiaison and Feasibility Agents
 Validates 2027 Veteran Dashboard Action Center enhancements
 """
+import logging
+
 import pytest
 from datetime import datetime
 from packages.core import (
     ScopeSignal,
-    FeasibilityScore,
-    EndorsementRequest,
     BrokerContact,
     ExtractedField,
     AgencyRequirement,
@@ -18,327 +18,313 @@ from packages.core import (
 from core.agents.broker_liaison_agent import BrokerLiaisonAgent
 from core.agents.feasibility_agent import FeasibilityAgent
 
+logger = logging.getLogger(__name__)
 
-class TestBrokerLiaisonAgent:
-    """Test BrokerLiaison agent for Task 1: The Outreach Bridge"""
-    
-    def test_draft_endorsement_request_success(self):
-        """Test successful endorsement request drafting"""
-        agent = BrokerLiaisonAgent()
-        
-        # Create test signal with broker contact
-        broker_contact = BrokerContact(
-            broker_name=ExtractedField(
-                field_name="broker_name",
-                value="Marsh & McLennan",
-                confidence=1.0
-            ),
-            broker_email=ExtractedField(
-                field_name="broker_email",
-                value="nyc.construction@marsh.com",
-                confidence=1.0
-            )
+# $0.007/doc cost-efficiency target shared by both agents
+_COST_TARGET_USD = 0.007
+
+
+# Agency groupings shared by parametrized tests and batch assessments
+_ALL_AGENCIES = tuple(AgencyRequirement)
+_LENIENT_AGENCIES = (AgencyRequirement.DDC, AgencyRequirement.HPD, AgencyRequirement.DOT)
+
+
+# Shared inputs for the SCA-vs-lenient-agency comparisons
+_SKEPTICAL_GAPS = ["Pollution Liability missing"]
+_SKEPTICAL_BID = (1000000, 0.15)  # (estimated_project_value, estimated_profit_margin)
+
+
+@pytest.fixture(scope="session")
+def agency_assessments():
+    """One assessment per agency from a single shared gap pricing, computed once"""
+    return FeasibilityAgent().assess_for_agencies(
+        _make_signal(AgencyRequirement.SCA, insurance_gaps=_SKEPTICAL_GAPS),
+        *_SKEPTICAL_BID,
+        agencies=list(_ALL_AGENCIES),
+    )
+
+
+# Validated once at import. Helpers derive per-test variants with
+# model_copy(update=...), which (like model_construct) skips validation,
+# so only these two bases ever pay for it.
+_BASE_BROKER_CONTACT = BrokerContact(
+    broker_name=ExtractedField(field_name="broker_name", value="Test Broker", confidence=1.0),
+    broker_email=ExtractedField(field_name="broker_email", value="test@broker.com", confidence=1.0)
+)
+_BASE_SIGNAL = ScopeSignal(
+    signal_id="SIG-BASE",
+    project_id="PROJ-BASE",
+    project_name="Base Project",
+    project_address="Test Address",
+    contractor_name="Test Contractor",
+    status=LeadStatus.CONTESTABLE,
+    missing_endorsements=["Additional Insured"],
+    insurance_gaps=[],
+    agency_requirements=[AgencyRequirement.SCA],
+    broker_contact=_BASE_BROKER_CONTACT
+)
+
+
+def _make_broker_contact(name="Test Broker", email="test@broker.com"):
+    """Copy the base BrokerContact with a different broker name and email"""
+    return _BASE_BROKER_CONTACT.model_copy(update={
+        "broker_name": _BASE_BROKER_CONTACT.broker_name.model_copy(update={"value": name}),
+        "broker_email": _BASE_BROKER_CONTACT.broker_email.model_copy(update={"value": email}),
+    })
+
+
+def _make_signal(agency, **overrides):
+    """Copy the base CONTESTABLE ScopeSignal for a single agency"""
+    fields = {
+        "signal_id": f"SIG-{agency.value}",
+        "project_id": f"PROJ-{agency.value}",
+        "project_name": f"{agency.value} Project",
+        "agency_requirements": [agency],
+    }
+    fields.update(overrides)
+    return _BASE_SIGNAL.model_copy(update=fields)
+
+
+@pytest.fixture(scope="module")
+def broker_batch():
+    """Ten SCA signals with distinct brokers, built once for cost-efficiency runs"""
+    return [
+        _make_signal(
+            AgencyRequirement.SCA,
+            signal_id=f"SIG-TEST-{i:03d}",
+            project_id=f"PROJ-{i}",
+            project_name=f"Test Project {i}",
+            broker_contact=_make_broker_contact(f"Test Broker {i}", f"broker{i}@test.com"),
         )
-        
-        signal = ScopeSignal(
-            signal_id="SIG-TEST-001",
-            project_id="PROJ-2027-001",
-            project_name="Hudson Yards Tower",
-            project_address="450 W 33rd St, NY",
-            contractor_name="Premier Construction",
-            status=LeadStatus.CONTESTABLE,
-            missing_endorsements=[
-                "Additional Insured - Primary & Non-Contributory",
-                "Waiver of Subrogation"
-            ],
-            insurance_gaps=["Pollution Liability missing"],
-            agency_requirements=[AgencyRequirement.SCA, AgencyRequirement.DDC],
-            broker_contact=broker_contact
+        for i in range(10)
+    ]
+
+
+@pytest.fixture(scope="module")
+def feasibility_batch():
+    """Ten DDC signals, built once for cost-efficiency runs"""
+    return [
+        _make_signal(
+            AgencyRequirement.DDC,
+            signal_id=f"SIG-FEAS-{i}",
+            project_id=f"PROJ-{i}",
+            project_name=f"Project {i}",
+            broker_contact=None,
         )
-        
-        # Draft endorsement
-        request = agent.draft_endorsement_request(signal)
-        
-        # Assertions
-        assert isinstance(request, EndorsementRequest)
-        assert request.signal_id == "SIG-TEST-001"
-        assert request.project_name == "Hudson Yards Tower"
-        assert len(request.required_endorsements) > 0
-        assert request.urgency_level in ["critical", "high", "standard"]
-        assert "Marsh & McLennan" in request.subject_line or "Marsh & McLennan" in request.email_body
-        
-        # Validate decision proof
-        assert request.decision_proof is not None
-        assert request.decision_proof.agent_id == "BrokerLiaison-v2.0"
-        assert request.decision_proof.confidence_score > 0.9
-        
-        # Validate agent handshake (Task 3)
-        assert request.decision_proof.agent_handshake is not None
-        handshake = request.decision_proof.agent_handshake
-        assert handshake.to_agent == "BrokerLiaison-v2.0"
-        assert handshake.validation_status == "handoff_validated"
-        
-        print(f"✅ Endorsement drafted: {request.request_id}")
-        print(f"   Urgency: {request.urgency_level}")
-        print(f"   Endorsements: {len(request.required_endorsements)}")
-        print(f"   Agent Handshake: {handshake.from_agent} → {handshake.to_agent}")
+        for i in range(10)
+    ]
+
+
+# BrokerLiaison agent - Task 1: The Outreach Bridge
+
+def test_draft_endorsement_request_success(broker_agent):
+    """Test successful endorsement request drafting"""
+    signal = _make_signal(
+        AgencyRequirement.SCA,
+        signal_id="SIG-TEST-001",
+        project_id="PROJ-2027-001",
+        project_name="Hudson Yards Tower",
+        project_address="450 W 33rd St, NY",
+        contractor_name="Premier Construction",
+        missing_endorsements=[
+            "Additional Insured - Primary & Non-Contributory",
+            "Waiver of Subrogation"
+        ],
+        insurance_gaps=["Pollution Liability missing"],
+        agency_requirements=[AgencyRequirement.SCA, AgencyRequirement.DDC],
+        broker_contact=_make_broker_contact("Marsh & McLennan", "nyc.construction@marsh.com")
+    )
     
-    def test_cost_efficiency_target(self):
-        """Test that agent meets $0.007/doc cost target"""
-        agent = BrokerLiaisonAgent()
-        
-        # Create multiple test signals
-        for i in range(10):
-            broker_contact = BrokerContact(
-                broker_name=ExtractedField(
-                    field_name="broker_name",
-                    value=f"Test Broker {i}",
-                    confidence=1.0
-                ),
-                broker_email=ExtractedField(
-                    field_name="broker_email",
-                    value=f"broker{i}@test.com",
-                    confidence=1.0
-                )
-            )
-            
-            signal = ScopeSignal(
-                signal_id=f"SIG-TEST-{i:03d}",
-                project_id=f"PROJ-{i}",
-                project_name=f"Test Project {i}",
-                project_address="Test Address",
-                contractor_name="Test Contractor",
-                status=LeadStatus.CONTESTABLE,
-                missing_endorsements=["Additional Insured"],
-                insurance_gaps=[],
-                agency_requirements=[AgencyRequirement.SCA],
-                broker_contact=broker_contact
-            )
-            
-            agent.draft_endorsement_request(signal)
-        
-        # Check statistics
-        stats = agent.get_statistics()
-        assert stats["requests_drafted"] == 10
-        assert stats["avg_cost_per_request"] <= 0.007  # Must meet target
-        assert stats["meets_efficiency_target"] is True
-        
-        print(f"✅ Cost efficiency validated:")
-        print(f"   Requests: {stats['requests_drafted']}")
-        print(f"   Avg cost: ${stats['avg_cost_per_request']:.4f}")
-        print(f"   Target: ${stats['target_cost']}")
-        print(f"   Status: {'✓ MEETS TARGET' if stats['meets_efficiency_target'] else '✗ ABOVE TARGET'}")
+    # Draft endorsement
+    request = broker_agent.draft_endorsement_request(signal)
     
-    def test_agency_specific_endorsements(self):
-        """Test that correct endorsements are generated per agency"""
-        agent = BrokerLiaisonAgent()
-        
-        # Test SCA requirements
-        broker_contact = BrokerContact(
-            broker_name=ExtractedField(field_name="broker_name", value="Test Broker", confidence=1.0),
-            broker_email=ExtractedField(field_name="broker_email", value="test@broker.com", confidence=1.0)
-        )
-        
-        signal_sca = ScopeSignal(
-            signal_id="SIG-SCA",
-            project_id="PROJ-SCA",
-            project_name="SCA Project",
-            project_address="School Address",
-            contractor_name="School Builder",
-            status=LeadStatus.CONTESTABLE,
-            missing_endorsements=["Additional Insured"],
-            insurance_gaps=[],
-            agency_requirements=[AgencyRequirement.SCA],
-            broker_contact=broker_contact
-        )
-        
-        request = agent.draft_endorsement_request(signal_sca)
-        
-        # SCA should require pollution liability
-        assert any("Pollution" in e for e in request.required_endorsements)
-        assert any("Primary & Non-Contributory" in e for e in request.required_endorsements)
-        
-        print(f"✅ Agency-specific endorsements validated for SCA")
-        print(f"   Endorsements: {request.required_endorsements}")
-
-
-class TestFeasibilityAgent:
-    """Test Feasibility Agent for Task 4: Predictive Risk & Profitability Drain"""
+    # Assertions
+    assert request.signal_id == "SIG-TEST-001"
+    assert request.project_name == "Hudson Yards Tower"
+    assert len(request.required_endorsements) > 0
+    assert request.urgency_level in ["critical", "high", "standard"]
+    assert "Marsh & McLennan" in request.subject_line or "Marsh & McLennan" in request.email_body
     
-    def test_profitability_drain_calculation(self):
-        """Test profitability drain calculation with skeptical veteran logic"""
-        agent = FeasibilityAgent()
-        
-        signal = ScopeSignal(
-            signal_id="SIG-FEAS-001",
-            project_id="PROJ-FEAS-001",
-            project_name="Test Feasibility Project",
-            project_address="Test Address",
-            contractor_name="Test Contractor",
-            status=LeadStatus.CONTESTABLE,
-            missing_endorsements=[
-                "Additional Insured - Primary & Non-Contributory",
-                "Waiver of Subrogation",
-                "Per Project Aggregate"
-            ],
-            insurance_gaps=[
-                "Pollution Liability missing",
-                "Professional Liability inadequate"
-            ],
-            agency_requirements=[AgencyRequirement.SCA]  # Strictest agency
-        )
-        
-        # Assess with $2.5M project, 15% profit margin
-        assessment = agent.assess_feasibility(
-            signal=signal,
-            estimated_project_value=2500000,
-            estimated_profit_margin=0.15
-        )
-        
-        # Assertions
-        assert isinstance(assessment, FeasibilityScore)
-        assert 0 <= assessment.overall_score <= 100
-        assert assessment.projected_premium_increase > 0
-        assert assessment.projected_profitability_drain > 0
-        assert assessment.recommendation in ["bid_with_caution", "bid_after_compliance", "do_not_bid"]
-        
-        # Check skeptical veteran logic applied (SCA has 1.5x multiplier)
-        assert "agency_strictness_multiplier" in assessment.risk_factors
-        assert assessment.risk_factors["agency_strictness_multiplier"] >= 1.0
-        
-        print(f"✅ Feasibility assessment completed:")
-        print(f"   Score: {assessment.overall_score:.1f}/100")
-        print(f"   Premium increase: ${assessment.projected_premium_increase:,.2f}")
-        print(f"   Profitability drain: {assessment.projected_profitability_drain:.1f}%")
-        print(f"   Recommendation: {assessment.recommendation}")
-        print(f"   Risk multiplier: {assessment.risk_factors.get('agency_strictness_multiplier', 0):.2f}x")
+    # Validate decision proof
+    assert request.decision_proof is not None
+    assert request.decision_proof.agent_id == BrokerLiaisonAgent.AGENT_ID
+    assert request.decision_proof.confidence_score > 0.9
     
-    def test_cost_efficiency_meets_target(self):
-        """Test that feasibility agent meets $0.007/assessment target"""
-        agent = FeasibilityAgent()
-        
-        # Run 10 assessments
-        for i in range(10):
-            signal = ScopeSignal(
-                signal_id=f"SIG-FEAS-{i}",
-                project_id=f"PROJ-{i}",
-                project_name=f"Project {i}",
-                project_address="Address",
-                contractor_name="Contractor",
-                status=LeadStatus.CONTESTABLE,
-                missing_endorsements=["Additional Insured"],
-                insurance_gaps=[],
-                agency_requirements=[AgencyRequirement.DDC]
-            )
-            
-            agent.assess_feasibility(signal, 1000000, 0.12)
-        
-        stats = agent.get_statistics()
-        assert stats["assessments_completed"] == 10
-        assert stats["avg_cost_per_assessment"] <= 0.007
-        assert stats["meets_efficiency_target"] is True
-        
-        print(f"✅ Feasibility cost efficiency validated:")
-        print(f"   Assessments: {stats['assessments_completed']}")
-        print(f"   Avg cost: ${stats['avg_cost_per_assessment']:.4f}")
-        print(f"   Target: ${stats['target_cost']}")
+    # Validate agent handshake (Task 3)
+    assert request.decision_proof.agent_handshake is not None
+    handshake = request.decision_proof.agent_handshake
+    assert handshake.to_agent == BrokerLiaisonAgent.AGENT_ID
+    assert handshake.validation_status == "handoff_validated"
     
-    def test_skeptical_veteran_logic(self):
-        """Test that skeptical veteran logic applies conservative estimates"""
-        agent = FeasibilityAgent()
-        
-        # Test with strictest agency (SCA)
-        signal_sca = ScopeSignal(
-            signal_id="SIG-SKEPTICAL",
-            project_id="PROJ-SKEPTICAL",
-            project_name="Skeptical Test",
-            project_address="Address",
-            contractor_name="Contractor",
-            status=LeadStatus.CONTESTABLE,
-            missing_endorsements=["Additional Insured"],
-            insurance_gaps=["Pollution Liability missing"],
-            agency_requirements=[AgencyRequirement.SCA]
-        )
-        
-        assessment_sca = agent.assess_feasibility(signal_sca, 1000000, 0.15)
-        
-        # Test with lenient agency (HPD)
-        signal_hpd = ScopeSignal(
-            signal_id="SIG-LENIENT",
-            project_id="PROJ-LENIENT",
-            project_name="Lenient Test",
-            project_address="Address",
-            contractor_name="Contractor",
-            status=LeadStatus.CONTESTABLE,
-            missing_endorsements=["Additional Insured"],
-            insurance_gaps=["Pollution Liability missing"],
-            agency_requirements=[AgencyRequirement.HPD]
-        )
-        
-        assessment_hpd = agent.assess_feasibility(signal_hpd, 1000000, 0.15)
-        
-        # SCA should have higher premium increase due to skeptical multiplier
-        assert assessment_sca.projected_premium_increase > assessment_hpd.projected_premium_increase
-        assert assessment_sca.overall_score <= assessment_hpd.overall_score  # SCA is riskier
-        
-        print(f"✅ Skeptical veteran logic validated:")
-        print(f"   SCA premium: ${assessment_sca.projected_premium_increase:,.2f}")
-        print(f"   HPD premium: ${assessment_hpd.projected_premium_increase:,.2f}")
-        print(f"   SCA more conservative: {assessment_sca.projected_premium_increase > assessment_hpd.projected_premium_increase}")
+    logger.debug(
+        "Endorsement drafted: %s (urgency=%s, endorsements=%d, handshake=%s → %s)",
+        request.request_id, request.urgency_level,
+        len(request.required_endorsements), handshake.from_agent, handshake.to_agent
+    )
+
+
+def test_cost_efficiency_target(broker_batch):
+    """Test that agent meets $0.007/doc cost target"""
+    agent = BrokerLiaisonAgent()
     
-    def test_agent_handshake_in_feasibility(self):
-        """Test Task 3: Agent handshake tracking in feasibility assessment"""
-        agent = FeasibilityAgent()
-        
-        signal = ScopeSignal(
-            signal_id="SIG-HANDSHAKE",
-            project_id="PROJ-HANDSHAKE",
-            project_name="Handshake Test",
-            project_address="Address",
-            contractor_name="Contractor",
-            status=LeadStatus.CONTESTABLE,
-            missing_endorsements=[],
-            insurance_gaps=[],
-            agency_requirements=[AgencyRequirement.DDC]
-        )
-        
-        assessment = agent.assess_feasibility(
-            signal=signal,
-            estimated_project_value=1000000,
-            from_agent="OpportunityAgent"
-        )
-        
-        # Validate agent handshake in reasoning chain
-        # Note: FeasibilityAgent doesn't expose decision_proof directly,
-        # but it creates handshake internally
-        assert len(assessment.reasoning) > 0
-        assert assessment.assessed_by_agent == "FeasibilityAgent-v2.0"
-        
-        print(f"✅ Agent handshake tracking validated")
-        print(f"   Assessed by: {assessment.assessed_by_agent}")
-        print(f"   Reasoning steps: {len(assessment.reasoning)}")
+    for signal in broker_batch:
+        agent.draft_endorsement_request(signal)
+    
+    # Check statistics
+    stats = agent.get_statistics()
+    assert stats["requests_drafted"] == 10
+    assert stats["target_cost"] == pytest.approx(_COST_TARGET_USD)
+    assert stats["avg_cost_per_request"] <= _COST_TARGET_USD  # Must meet target
+    assert stats["meets_efficiency_target"] is True
+    
+    logger.debug(
+        "Broker cost efficiency: %d requests, avg $%.4f (target $%s)",
+        stats["requests_drafted"], stats["avg_cost_per_request"], stats["target_cost"]
+    )
 
 
-if __name__ == "__main__":
-    print("=" * 60)
-    print("Running Veteran Dashboard Action Center Tests (2027)")
-    print("=" * 60)
+@pytest.mark.parametrize("agency,expected_endorsements", [
+    (AgencyRequirement.SCA, ["Pollution", "Primary & Non-Contributory"]),
+    (AgencyRequirement.DDC, ["Broad Form", "Professional Liability"]),
+    (AgencyRequirement.HPD, ["Lead-Based Paint"]),
+    (AgencyRequirement.DOT, ["Highway Traffic"]),
+])
+def test_agency_specific_endorsements(broker_agent, agency, expected_endorsements):
+    """Test that correct endorsements are generated per agency"""
+    request = broker_agent.draft_endorsement_request(_make_signal(agency))
+    
+    for expected in expected_endorsements:
+        assert any(expected in e for e in request.required_endorsements)
+    
+    logger.debug("%s endorsements: %s", agency.value, request.required_endorsements)
+
+
+# Feasibility agent - Task 4: Predictive Risk & Profitability Drain
+
+def test_profitability_drain_calculation(feasibility_agent):
+    """Test profitability drain calculation with skeptical veteran logic"""
+    signal = _make_signal(
+        AgencyRequirement.SCA,  # Strictest agency
+        signal_id="SIG-FEAS-001",
+        project_id="PROJ-FEAS-001",
+        project_name="Test Feasibility Project",
+        missing_endorsements=[
+            "Additional Insured - Primary & Non-Contributory",
+            "Waiver of Subrogation",
+            "Per Project Aggregate"
+        ],
+        insurance_gaps=[
+            "Pollution Liability missing",
+            "Professional Liability inadequate"
+        ],
+        broker_contact=None
+    )
+    
+    # Assess with $2.5M project, 15% profit margin
+    assessment = feasibility_agent.assess_feasibility(
+        signal=signal,
+        estimated_project_value=2500000,
+        estimated_profit_margin=0.15
+    )
+    
+    # Assertions
+    assert 0 <= assessment.overall_score <= 100
+    assert assessment.projected_premium_increase > 0
+    assert assessment.projected_profitability_drain > 0
+    assert assessment.recommendation in ["bid_with_caution", "bid_after_compliance", "do_not_bid"]
+    
+    # Check skeptical veteran logic applied (SCA has 1.5x multiplier)
+    assert "agency_strictness_multiplier" in assessment.risk_factors
+    assert assessment.risk_factors["agency_strictness_multiplier"] >= 1.0
+    
+    logger.debug(
+        "Feasibility: score=%.1f premium=$%.2f drain=%.1f%% recommendation=%s multiplier=%.2fx",
+        assessment.overall_score, assessment.projected_premium_increase,
+        assessment.projected_profitability_drain, assessment.recommendation,
+        assessment.risk_factors.get("agency_strictness_multiplier", 0)
+    )
+
+
+def test_cost_efficiency_meets_target(feasibility_batch):
+    """Test that feasibility agent meets $0.007/assessment target"""
+    agent = FeasibilityAgent()
     
-    # Run BrokerLiaison tests
-    print("\n🔵 Testing BrokerLiaison Agent (Task 1)...")
-    test_broker = TestBrokerLiaisonAgent()
-    test_broker.test_draft_endorsement_request_success()
-    test_broker.test_cost_efficiency_target()
-    test_broker.test_agency_specific_endorsements()
+    for signal in feasibility_batch:
+        agent.assess_feasibility(signal, 1000000, 0.12)
     
-    # Run Feasibility tests
-    print("\n🔵 Testing Feasibility Agent (Task 4)...")
-    test_feas = TestFeasibilityAgent()
-    test_feas.test_profitability_drain_calculation()
-    test_feas.test_cost_efficiency_meets_target()
-    test_feas.test_skeptical_veteran_logic()
-    test_feas.test_agent_handshake_in_feasibility()
+    stats = agent.get_statistics()
+    assert stats["assessments_completed"] == 10
+    assert stats["target_cost"] == pytest.approx(_COST_TARGET_USD)
+    assert stats["avg_cost_per_assessment"] <= _COST_TARGET_USD
+    assert stats["meets_efficiency_target"] is True
     
-    print("\n" + "=" * 60)
-    print("✅ ALL TESTS PASSED - Action Center Ready for 2027")
-    print("=" * 60)
+    logger.debug(
+        "Feasibility cost efficiency: %d assessments, avg $%.4f (target $%s)",
+        stats["assessments_completed"], stats["avg_cost_per_assessment"], stats["target_cost"]
+    )
+
+
+@pytest.mark.parametrize("lenient_agency", _LENIENT_AGENCIES)
+def test_skeptical_veteran_logic(agency_assessments, lenient_agency):
+    """Test that skeptical veteran logic applies conservative estimates"""
+    # Strictest agency (SCA) vs a more lenient one
+    assessment_sca = agency_assessments[AgencyRequirement.SCA]
+    assessment_lenient = agency_assessments[lenient_agency]
+    
+    # SCA should have higher premium increase due to skeptical multiplier
+    assert assessment_sca.projected_premium_increase > assessment_lenient.projected_premium_increase
+    assert assessment_sca.overall_score <= assessment_lenient.overall_score  # SCA is riskier
+    
+    logger.debug(
+        "Skeptical premiums: SCA=$%.2f %s=$%.2f",
+        assessment_sca.projected_premium_increase,
+        lenient_agency.value, assessment_lenient.projected_premium_increase
+    )
+
+
+@pytest.mark.parametrize("agency", _ALL_AGENCIES)
+def test_assess_for_agencies_matches_single_agency(feasibility_agent, agency_assessments, agency):
+    """Test that the shared-gap batch matches a standalone per-agency assessment"""
+    single = feasibility_agent.assess_feasibility(
+        _make_signal(agency, insurance_gaps=_SKEPTICAL_GAPS),
+        *_SKEPTICAL_BID,
+    )
+    batched = agency_assessments[agency]
+    
+    assert batched.projected_premium_increase == pytest.approx(single.projected_premium_increase)
+    assert batched.overall_score == pytest.approx(single.overall_score)
+    assert batched.recommendation == single.recommendation
+    assert batched.risk_factors == single.risk_factors
+
+
+def test_agent_handshake_in_feasibility(feasibility_agent):
+    """Test Task 3: Agent handshake tracking in feasibility assessment"""
+    signal = _make_signal(
+        AgencyRequirement.DDC,
+        signal_id="SIG-HANDSHAKE",
+        project_id="PROJ-HANDSHAKE",
+        project_name="Handshake Test",
+        missing_endorsements=[],
+        broker_contact=None
+    )
+    
+    assessment = feasibility_agent.assess_feasibility(
+        signal=signal,
+        estimated_project_value=1000000,
+        from_agent="OpportunityAgent"
+    )
+    
+    # Validate agent handshake in reasoning chain
+    # Note: FeasibilityAgent doesn't expose decision_proof directly,
+    # but it creates handshake internally
+    assert len(assessment.reasoning) > 0
+    assert assessment.assessed_by_agent == FeasibilityAgent.AGENT_ID
+    
+    logger.debug(
+        "Assessed by %s with %d reasoning steps",
+        assessment.assessed_by_agent, len(assessment.reasoning)
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
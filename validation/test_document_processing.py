@@ -1,10 +1,10 @@
 """Document processing tests - Contractor document validation"""
 import pytest
 import random
-from datetime import datetime, timedelta
+from datetime import timedelta
 from core.models import (
     DocumentExtractionState, DocumentType, ExtractedField,
-    SourceCoordinate, ExpirationStatus, PIIRedaction
+    SourceCoordinate, ExpirationStatus, PIIRedaction, ExtractionMethod
 )
 from core.agents.document_extraction_agent import extract_document_fields, _detect_pii
 from core.agents.insurance_validation_agent import (
@@ -13,8 +13,11 @@ from core.agents.insurance_validation_agent import (
 )
 from core.agents.document_quality_agent import assess_document_quality
 
-# Set seed for deterministic tests
-random.seed(42)
+
+@pytest.fixture(autouse=True)
+def _seed_random():
+    """Seed per test so results don't depend on test order or xdist worker"""
+    random.seed(42)
 
 
 class TestDocumentExtraction:
@@ -82,6 +85,19 @@ class TestDocumentExtraction:
             assert 0.0 <= bbox.width <= 1.0, "Width out of range"
             assert 0.0 <= bbox.height <= 1.0, "Height out of range"
     
+    def test_extracted_field_normalization(self):
+        """Verify field names are interned and extraction methods validated"""
+        first = ExtractedField(field_name="".join(["policy", "_number"]), value="A", confidence=0.9)
+        second = ExtractedField(field_name="".join(["policy", "_num", "ber"]), value="B", confidence=0.9,
+                                extraction_method="LLM")
+        
+        assert first.field_name is second.field_name
+        assert first.extraction_method == ExtractionMethod.OCR
+        assert second.extraction_method == "LLM"
+        with pytest.raises(Exception):  # Pydantic raises ValidationError
+            ExtractedField(field_name="policy_number", value="C", confidence=0.9,
+                           extraction_method="GUESS")
+    
     def test_extraction_error_handling(self):
         """Verify robust error handling for unsupported document types"""
         state = DocumentExtractionState(
@@ -103,12 +119,18 @@ class TestDocumentExtraction:
 class TestPIIRedaction:
     """Test PII detection and redaction"""
     
-    def test_pii_detection_ssn(self):
-        """Verify SSN detection"""
+    @pytest.mark.parametrize("field_name,value,expected_type,expected_redaction", [
+        ("ssn", "123-45-6789", "SSN", "***-**-6789"),
+        ("contact_phone", "212-555-1234", "Phone", "***-***-1234"),
+        # Emails are fully redacted for security
+        ("email", "john.smith@construction.com", "Email", "***@***"),
+    ])
+    def test_pii_detection(self, field_name, value, expected_type, expected_redaction):
+        """Verify SSN, phone and email detection and redaction"""
         fields = [
             ExtractedField(
-                field_name="ssn",
-                value="123-45-6789",
+                field_name=field_name,
+                value=value,
                 confidence=0.95,
                 extraction_method="OCR"
             )
@@ -116,45 +138,11 @@ class TestPIIRedaction:
         
         redactions = _detect_pii(fields)
         
-        assert len(redactions) == 1, "Should detect 1 SSN"
-        assert redactions[0].pii_type == "SSN"
-        assert "***-**-" in redactions[0].redacted_value
+        assert len(redactions) == 1, f"Should detect 1 {expected_type}"
+        assert redactions[0].pii_type == expected_type
+        assert redactions[0].redacted_value == expected_redaction
         assert fields[0].redacted == True
     
-    def test_pii_detection_phone(self):
-        """Verify phone number detection"""
-        fields = [
-            ExtractedField(
-                field_name="contact_phone",
-                value="212-555-1234",
-                confidence=0.92,
-                extraction_method="OCR"
-            )
-        ]
-        
-        redactions = _detect_pii(fields)
-        
-        assert len(redactions) == 1, "Should detect 1 phone number"
-        assert redactions[0].pii_type == "Phone"
-        assert "***" in redactions[0].redacted_value
-    
-    def test_pii_detection_email(self):
-        """Verify email detection"""
-        fields = [
-            ExtractedField(
-                field_name="email",
-                value="john.smith@construction.com",
-                confidence=0.94,
-                extraction_method="OCR"
-            )
-        ]
-        
-        redactions = _detect_pii(fields)
-        
-        assert len(redactions) == 1, "Should detect 1 email"
-        assert redactions[0].pii_type == "Email"
-        assert redactions[0].redacted_value == "***@***", "Email should be fully redacted for security"
-    
     def test_pii_no_false_positives(self):
         """Verify no PII false positives on normal data"""
         fields = [
@@ -170,11 +158,26 @@ class TestPIIRedaction:
         
         assert len(redactions) == 0, "Should not detect PII in policy number"
 
+    def test_pii_detection_multiple_types_in_one_field(self):
+        """Verify a single scan reports every PII type present in a field"""
+        fields = [
+            ExtractedField(
+                field_name="contact_notes",
+                value="SSN 123-45-6789, call 212-555-1234 or j.smith@construction.com",
+                confidence=0.90,
+                extraction_method="OCR"
+            )
+        ]
+
+        redactions = _detect_pii(fields)
+
+        assert [r.pii_type for r in redactions] == ["SSN", "Phone", "Email"]
+
 
 class TestInsuranceValidation:
     """Test insurance-specific validation logic"""
     
-    def test_additional_insured_validation(self):
+    def test_additional_insured_validation(self, now):
         """Verify Additional Insured requirement check"""
         state = DocumentExtractionState(
             document_id="COI-TEST-004",
@@ -212,7 +215,7 @@ class TestInsuranceValidation:
                 ),
                 ExtractedField(
                     field_name="expiration_date",
-                    value=(datetime.now() + timedelta(days=60)).strftime("%Y-%m-%d"),
+                    value=(now + timedelta(days=60)).strftime("%Y-%m-%d"),
                     confidence=0.91,
                     extraction_method="OCR"
                 ),
@@ -290,46 +293,25 @@ class TestInsuranceValidation:
 class TestExpirationValidation:
     """Test expiration date verification logic"""
     
-    def test_expired_date_classification(self):
-        """Verify expired date is correctly classified"""
-        field = ExtractedField(
-            field_name="expiration_date",
-            value=(datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"),
-            confidence=0.91,
-            extraction_method="OCR"
-        )
-        
-        status = _check_expiration_date(field)
-        
-        assert status == ExpirationStatus.EXPIRED, "Should classify as EXPIRED"
-    
-    def test_expiring_soon_classification(self):
-        """Verify expiring soon (within 30 days) classification"""
-        field = ExtractedField(
-            field_name="expiration_date",
-            value=(datetime.now() + timedelta(days=15)).strftime("%Y-%m-%d"),
-            confidence=0.91,
-            extraction_method="OCR"
-        )
-        
-        status = _check_expiration_date(field)
-        
-        assert status == ExpirationStatus.EXPIRING_SOON, "Should classify as EXPIRING_SOON"
-    
-    def test_valid_date_classification(self):
-        """Verify valid date (>30 days) classification"""
+    @pytest.mark.parametrize("delta_days,expected", [
+        (-30, ExpirationStatus.EXPIRED),
+        (15, ExpirationStatus.EXPIRING_SOON),  # Within 30 days
+        (90, ExpirationStatus.VALID),          # More than 30 days
+    ])
+    def test_classification(self, now, delta_days, expected):
+        """Verify expired / expiring soon / valid date classification"""
         field = ExtractedField(
             field_name="expiration_date",
-            value=(datetime.now() + timedelta(days=90)).strftime("%Y-%m-%d"),
+            value=(now + timedelta(days=delta_days)).strftime("%Y-%m-%d"),
             confidence=0.91,
             extraction_method="OCR"
         )
         
-        status = _check_expiration_date(field)
+        status = _check_expiration_date(field, today=now)
         
-        assert status == ExpirationStatus.VALID, "Should classify as VALID"
+        assert status == expected, f"Should classify as {expected.value}"
     
-    def test_license_expiration_validation(self):
+    def test_license_expiration_validation(self, now):
         """Verify license expiration validation"""
         state = DocumentExtractionState(
             document_id="LIC-TEST-002",
@@ -343,7 +325,7 @@ class TestExpirationValidation:
                 ),
                 ExtractedField(
                     field_name="expiration_date",
-                    value=(datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d"),
+                    value=(now - timedelta(days=10)).strftime("%Y-%m-%d"),
                     confidence=0.89,
                     extraction_method="OCR"
                 )
@@ -0,0 +1,20 @@
+"""
+Shared fixtures for the due-diligence suite
+"""
+import pytest
+from pathlib import Path
+
+from packages.agents.guard.validator import validate_coi
+
+
+SAMPLE_COI_PATHS = (
+    "sample_data/coi_compliant.pdf",
+    "sample_data/coi_missing_waiver.pdf",
+    "sample_data/coi_illegible.pdf",
+)
+
+
+@pytest.fixture(scope="session")
+def validated_coi():
+    """validate_coi results for each sample COI, computed once per session"""
+    return {path: validate_coi(Path(path)) for path in SAMPLE_COI_PATHS}
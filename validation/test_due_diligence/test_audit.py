@@ -1,6 +1,8 @@
 """
 Tests for Core Audit Module - DecisionProof Engine
 """
+import io
+import re
 import pytest
 from datetime import datetime
 
@@ -13,6 +15,10 @@ from packages.core.audit import (
 )
 
 
+# SHA-256 hex digest: exactly 64 lowercase hex characters
+_HEX64 = re.compile(r"\A[0-9a-f]{64}\Z")
+
+
 class TestLogicCitation:
     """Test LogicCitation model"""
     
@@ -42,6 +48,21 @@ class TestLogicCitation:
         assert "NYC_RCNY_101_08" in text
         assert "§101-08(c)(3)" in text
         assert "0.95" in text
+    
+    def test_citation_text_follows_copy_updates(self):
+        """Test cached citation text is not carried over to updated copies"""
+        citation = LogicCitation(
+            standard=ComplianceStandard.NYC_RCNY_101_08,
+            clause="§101-08(c)(3)",
+            interpretation="Additional Insured requirement",
+            confidence=0.95
+        )
+        assert citation.to_text() is citation.to_text()
+        
+        updated = citation.model_copy(update={"clause": "§101-08(d)"})
+        
+        assert "§101-08(d)" in updated.to_text()
+        assert "§101-08(c)(3)" in citation.to_text()
 
 
 class TestDecisionProof:
@@ -63,13 +84,41 @@ class TestDecisionProof:
         hash1 = proof.generate_hash()
         
         # Hash should be 64 characters (SHA-256 hex)
-        assert len(hash1) == 64
-        assert all(c in '0123456789abcdef' for c in hash1)
+        assert _HEX64.match(hash1) is not None
         
         # Same data should produce same hash
         hash2 = proof.generate_hash()
         assert hash1 == hash2
-    
+
+    def test_hash_canonical_form_is_stable(self):
+        """Test that the canonical hash input is unchanged, so stored proofs still verify"""
+        proof = DecisionProof(
+            decision_id="TEST-001",
+            timestamp=datetime(2026, 1, 1, 9, 30),
+            agent_name="Guard",
+            input_data={
+                "doc": "coi.pdf",
+                "checked_at": datetime(2026, 1, 1, 9, 0),
+                "limits": [2000000, 4000000]
+            },
+            decision="PASS",
+            confidence=0.98,
+            logic_citations=[
+                LogicCitation(
+                    standard=ComplianceStandard.NYC_RCNY_101_08,
+                    clause="§101-08(c)(3)",
+                    interpretation="Additional Insured present",
+                    confidence=0.95
+                )
+            ],
+            reasoning="All requirements met",
+            risk_level="LOW"
+        )
+
+        assert proof.generate_hash() == (
+            "ad4f642d5579a3126baa36a2f8b115b880e32cf9af0223b31eaa7620e3d08a1e"
+        )
+
     def test_hash_deterministic(self):
         """Test that identical proofs produce identical hashes"""
         proof1 = create_decision_proof(
@@ -106,6 +155,7 @@ class TestDecisionProof:
         )
         
         # Should verify successfully
+        assert _HEX64.match(proof.proof_hash) is not None
         assert proof.verify_hash() == True
         
         # Tamper with data
@@ -114,6 +164,57 @@ class TestDecisionProof:
         # Should fail verification
         assert proof.verify_hash() == False
     
+    def test_hash_verification_rejects_malformed_hash(self):
+        """Test that a stored hash that isn't hex fails verification instead of raising"""
+        proof = create_decision_proof(
+            agent_name="Guard",
+            decision="APPROVED",
+            input_data={"test": "data"},
+            logic_citations=[],
+            reasoning="Test",
+            confidence=0.95
+        )
+        
+        proof.proof_hash = "not-a-sha256-digest"
+        
+        assert proof.verify_hash() == False
+    
+    @pytest.mark.parametrize("mangle", [
+        str.upper,
+        lambda h: h[:32] + " " + h[32:],  # bytes.fromhex skips the space
+        lambda h: h + "\n",
+    ])
+    def test_hash_verification_rejects_non_canonical_hash(self, mangle):
+        """Test that a stored hash only verifies in its canonical lowercase form"""
+        proof = create_decision_proof(
+            agent_name="Guard",
+            decision="APPROVED",
+            input_data={"test": "data"},
+            logic_citations=[],
+            reasoning="Test",
+            confidence=0.95
+        )
+        assert proof.verify_hash() == True
+        
+        proof.proof_hash = mangle(proof.proof_hash)
+        
+        assert proof.verify_hash() == False
+    
+    def test_hash_verification_detects_input_tampering(self):
+        """Test that in-place edits to nested input data are caught"""
+        proof = create_decision_proof(
+            agent_name="Guard",
+            decision="APPROVED",
+            input_data={"extracted_fields": {"gl_aggregate": 4000000}},
+            logic_citations=[],
+            reasoning="Test",
+            confidence=0.95
+        )
+        
+        proof.input_data["extracted_fields"]["gl_aggregate"] = 1000000
+        
+        assert proof.verify_hash() == False
+    
     def test_finalize(self):
         """Test finalize method"""
         proof = DecisionProof(
@@ -134,7 +235,7 @@ class TestDecisionProof:
         proof.finalize()
         
         # Now has hash
-        assert len(proof.proof_hash) == 64
+        assert _HEX64.match(proof.proof_hash) is not None
         assert proof.verify_hash() == True
 
 
@@ -195,6 +296,27 @@ class TestCreateDecisionProof:
         assert "REJECTED" in report
         assert "SHA-256" in report
 
+    
+    def test_audit_report_streams_to_sink(self):
+        """Test audit reports can be written back to back into one sink"""
+        proofs = [
+            create_decision_proof(
+                agent_name="Guard",
+                decision=decision,
+                input_data={"doc": "test.pdf"},
+                logic_citations=[],
+                reasoning="Streamed report",
+                confidence=0.92
+            )
+            for decision in ("APPROVED", "REJECTED")
+        ]
+        sink = io.StringIO()
+        
+        for proof in proofs:
+            assert proof.to_audit_report(out=sink) == ""
+        
+        assert sink.getvalue() == "".join(p.to_audit_report() + "\n" for p in proofs)
+
 
 class TestValidateDecisionProof:
     """Test proof validation function"""
@@ -8,6 +8,7 @@ from datetime import datetime
 
 from packages.core.telemetry import (
     calculate_llm_cost,
+    calculate_llm_cost_batch,
     track_agent_cost,
     get_cost_summary,
     validate_cost_target,
@@ -36,6 +37,24 @@ class TestCostCalculation:
         
         assert cost < 0.007, f"Cost {cost} exceeds $0.007 target"
         assert cost == 0.000625  # Expected cost
+    
+    def test_batch_matches_scalar(self):
+        """Verify batch costs equal per-call costs, including unknown-model fallback"""
+        models = ["claude-3-haiku", "gpt-4o-vision", "llama-3.1-70b", "unknown-model"]
+        input_tokens = [1000, 2000, 1500, 800]
+        output_tokens = [300, 150, 500, 100]
+        
+        costs = calculate_llm_cost_batch(models, input_tokens, output_tokens)
+        
+        assert costs == [
+            calculate_llm_cost(m, i, o)
+            for m, i, o in zip(models, input_tokens, output_tokens)
+        ]
+    
+    def test_batch_rejects_mismatched_lengths(self):
+        """Verify batch inputs must line up call by call"""
+        with pytest.raises(ValueError):
+            calculate_llm_cost_batch(["claude-3-haiku"], [1000, 2000], [300])
 
 
 if __name__ == "__main__":
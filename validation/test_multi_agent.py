@@ -1,21 +1,74 @@
 """Tests for multi-agent collaboration system"""
 import pytest
 import random
-from core.multi_agent_supervisor import run_multi_agent_compliance_check, run_batch_multi_agent_compliance
 from core.config import BUSINESS_CONFIG
 
 
-# Set global seed for deterministic tests
-random.seed(42)
+# Multi-agent may run up to 50% over the single-agent per-site budget
+MAX_MA_COST = BUSINESS_CONFIG['cost_per_site_budget'] * 1.5
+
+
+@pytest.fixture(autouse=True)
+def _seed_random():
+    """Re-seed per test so results don't depend on test order"""
+    random.seed(42)
+    yield
+    random.seed()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _instant_backoff():
+    """
+    Skip the permit agent's retry backoff; retries still happen, just without
+    waiting. Capping the backoff at 0 leaves every other sleep alone, so the
+    mock NYC API keeps its simulated latency
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(BUSINESS_CONFIG["retry_limits"], "max_backoff", 0)
+        yield
+
+
+@pytest.fixture(scope="session")
+def run_ma():
+    """Deferred import: the supervisor pulls in langgraph, which is slow to load"""
+    from core.multi_agent_supervisor import run_multi_agent_compliance_check
+    return run_multi_agent_compliance_check
+
+
+@pytest.fixture(scope="session")
+def run_batch_ma():
+    """Deferred import of the batch runner, see run_ma"""
+    from core.multi_agent_supervisor import run_batch_multi_agent_compliance
+    return run_batch_multi_agent_compliance
+
+
+@pytest.fixture(scope="module")
+def ma_result(_instant_backoff, run_ma):
+    """One seeded multi-agent run shared by tests that only inspect its output"""
+    random.seed(42)
+    return run_ma("SITE-SHARED-001")
+
+
+@pytest.fixture(scope="module")
+def ma_outputs_by_name(ma_result):
+    """Agent outputs of the shared run, keyed by agent name"""
+    return {o.agent_name: o for o in ma_result.agent_outputs}
+
+
+@pytest.fixture(scope="module")
+def ma_batch_results(_instant_backoff, run_batch_ma):
+    """Seeded batch run over three sites"""
+    random.seed(42)
+    site_ids = [f"SITE-BATCH-MA-{i:03d}" for i in range(3)]
+    return site_ids, run_batch_ma(site_ids)
 
 
 class TestMultiAgentCollaboration:
     """Test suite for parallel multi-agent execution"""
     
-    def test_multi_agent_execution(self):
+    def test_multi_agent_execution(self, ma_result):
         """Verify all agents execute successfully"""
-        random.seed(42)
-        result = run_multi_agent_compliance_check("SITE-MA-001")
+        result = ma_result
         
         # Should have outputs from all 5 agents
         agent_names = [output.agent_name for output in result.agent_outputs]
@@ -26,16 +79,9 @@ class TestMultiAgentCollaboration:
         
         assert len(agent_names) == 5, f"Expected 5 agents, got {len(agent_names)}"
     
-    def test_red_team_validation(self):
+    def test_red_team_validation(self, ma_outputs_by_name):
         """Verify red team agent reduces false positives"""
-        random.seed(42)
-        result = run_multi_agent_compliance_check("SITE-RT-001")
-        
-        # Find red team output
-        red_team_output = next(
-            (o for o in result.agent_outputs if o.agent_name == "red_team_agent"),
-            None
-        )
+        red_team_output = ma_outputs_by_name.get("red_team_agent")
         
         assert red_team_output is not None, "Red team agent didn't execute"
         assert red_team_output.status == "success", "Red team agent failed"
@@ -45,16 +91,9 @@ class TestMultiAgentCollaboration:
         assert "violations_challenged" in data
         assert "validation_pass_rate" in data
     
-    def test_synthesis_agent_consensus(self):
+    def test_synthesis_agent_consensus(self, ma_outputs_by_name):
         """Verify synthesis agent combines findings from parallel agents"""
-        random.seed(42)
-        result = run_multi_agent_compliance_check("SITE-SYN-001")
-        
-        # Find synthesis output
-        synthesis_output = next(
-            (o for o in result.agent_outputs if o.agent_name == "synthesis_agent"),
-            None
-        )
+        synthesis_output = ma_outputs_by_name.get("synthesis_agent")
         
         assert synthesis_output is not None, "Synthesis agent didn't execute"
         assert synthesis_output.status == "success", "Synthesis agent failed"
@@ -64,16 +103,9 @@ class TestMultiAgentCollaboration:
         assert "synthesis_notes" in data
         assert "consensus_reached" in data
     
-    def test_risk_scorer_final_assessment(self):
+    def test_risk_scorer_final_assessment(self, ma_outputs_by_name):
         """Verify risk scorer provides final consensus assessment"""
-        random.seed(42)
-        result = run_multi_agent_compliance_check("SITE-RS-001")
-        
-        # Find risk scorer output
-        risk_output = next(
-            (o for o in result.agent_outputs if o.agent_name == "risk_scorer"),
-            None
-        )
+        risk_output = ma_outputs_by_name.get("risk_scorer")
         
         assert risk_output is not None, "Risk scorer didn't execute"
         assert risk_output.status == "success", "Risk scorer failed"
@@ -84,22 +116,17 @@ class TestMultiAgentCollaboration:
         assert "risk_category" in data
         assert "agent_consensus" in data
     
-    def test_parallel_execution_cost(self):
+    def test_parallel_execution_cost(self, ma_result):
         """Verify multi-agent execution maintains reasonable cost"""
-        random.seed(42)
-        result = run_multi_agent_compliance_check("SITE-COST-001")
+        result = ma_result
         
         # Multi-agent should still be under budget (though higher than single agent)
-        # Allow up to $0.06 per site for multi-agent (50% higher than single agent)
-        max_cost = BUSINESS_CONFIG['cost_per_site_budget'] * 1.5
-        
-        assert result.total_cost <= max_cost, \
-            f"Multi-agent cost ${result.total_cost:.4f} exceeds ${max_cost:.4f} threshold"
+        assert result.total_cost <= MAX_MA_COST, \
+            f"Multi-agent cost ${result.total_cost:.4f} exceeds ${MAX_MA_COST:.4f} threshold"
     
-    def test_multi_agent_token_tracking(self):
+    def test_multi_agent_token_tracking(self, ma_result):
         """Verify token usage across all agents is tracked accurately"""
-        random.seed(42)
-        result = run_multi_agent_compliance_check("SITE-TOKEN-MA-001")
+        result = ma_result
         
         # Sum agent token usage
         agent_tokens = sum(
@@ -115,14 +142,12 @@ class TestMultiAgentCollaboration:
             output.usd_cost for output in result.agent_outputs 
             if output.status == "success"
         )
-        assert abs(result.total_cost - expected_cost) < 0.0001, \
+        assert result.total_cost == pytest.approx(expected_cost, abs=1e-4), \
             f"Cost mismatch: state=${result.total_cost:.4f}, expected=${expected_cost:.4f}"
     
-    def test_batch_multi_agent_processing(self):
+    def test_batch_multi_agent_processing(self, ma_batch_results):
         """Verify batch processing with multi-agent architecture"""
-        random.seed(42)
-        site_ids = [f"SITE-BATCH-MA-{i:03d}" for i in range(3)]
-        results = run_batch_multi_agent_compliance(site_ids)
+        site_ids, results = ma_batch_results
         
         assert len(results) == 3, f"Batch processing didn't return all results: got {len(results)}"
         
@@ -132,13 +157,13 @@ class TestMultiAgentCollaboration:
             assert len(result.agent_outputs) >= 5, \
                 f"Incomplete agent execution for {result.site_id}: only {len(result.agent_outputs)} agents"
     
-    def test_multi_agent_deterministic_output(self):
+    def test_multi_agent_deterministic_output(self, run_ma):
         """Verify multi-agent system produces consistent results with seed"""
-        random.seed(42)
-        result1 = run_multi_agent_compliance_check("SITE-DET-MA-001")
+        result1 = run_ma("SITE-DET-MA-001")
         
+        # Re-seed so the second run starts from the same state as the first
         random.seed(42)
-        result2 = run_multi_agent_compliance_check("SITE-DET-MA-001")
+        result2 = run_ma("SITE-DET-MA-001")
         
         assert len(result1.violations) == len(result2.violations), \
             f"Violation detection not deterministic: {len(result1.violations)} vs {len(result2.violations)}"
@@ -146,11 +171,10 @@ class TestMultiAgentCollaboration:
         assert result1.risk_score == result2.risk_score, \
             f"Risk scoring not deterministic: {result1.risk_score} vs {result2.risk_score}"
     
-    def test_agent_error_isolation(self):
+    def test_agent_error_isolation(self, run_ma):
         """Verify that errors in one agent don't crash entire system"""
-        random.seed(42)
         # This should complete even if permit agent fails
-        result = run_multi_agent_compliance_check("SITE-ERROR-MA-001")
+        result = run_ma("SITE-ERROR-MA-001")
         
         # System should complete with at least vision and risk scorer
         assert result.risk_score >= 0, "Risk score calculation failed"
@@ -0,0 +1,130 @@
+"""Tests for the process-wide NYC API circuit breaker"""
+import threading
+import pytest
+from core.config import NYCApiBreaker
+
+
+class TestNYCApiBreaker:
+    """Test breaker state transitions"""
+
+    def test_opens_after_threshold_failures(self):
+        """Breaker stays closed below the threshold and opens at it"""
+        breaker = NYCApiBreaker(fail_threshold=3, reset_timeout=30.0)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == NYCApiBreaker.CLOSED
+        assert breaker.allow() is True
+
+        breaker.record_failure()
+        assert breaker.state == NYCApiBreaker.OPEN
+        assert breaker.allow() is False
+
+    def test_success_resets_failure_count(self):
+        """Failures must be consecutive to trip the breaker"""
+        breaker = NYCApiBreaker(fail_threshold=2, reset_timeout=30.0)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == NYCApiBreaker.CLOSED
+
+    def test_half_open_probe_after_timeout(self):
+        """After reset_timeout a probe is allowed; its outcome closes or re-opens"""
+        breaker = NYCApiBreaker(fail_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        assert breaker.state == NYCApiBreaker.OPEN
+
+        assert breaker.allow() is True
+        assert breaker.state == NYCApiBreaker.HALF_OPEN
+        breaker.record_failure()
+        assert breaker.state == NYCApiBreaker.OPEN
+
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.state == NYCApiBreaker.CLOSED
+        assert breaker.failure_count == 0
+        assert breaker.trip_count == 0
+
+    def test_cooldown_grows_with_consecutive_trips(self):
+        """Each failed probe doubles the cooldown, up to the cap"""
+        breaker = NYCApiBreaker(fail_threshold=1, reset_timeout=30.0, reset_cap=100.0)
+        cooldowns = []
+
+        breaker.record_failure()
+        for _ in range(3):
+            cooldowns.append(breaker.cooldown)
+            breaker.state = NYCApiBreaker.HALF_OPEN  # As allow() would after the cooldown
+            breaker.record_failure()
+        cooldowns.append(breaker.cooldown)
+
+        assert cooldowns == [30.0, 60.0, 100.0, 100.0]
+        assert breaker.allow() is False
+
+    def test_half_open_admits_single_probe(self):
+        """Concurrent callers in half-open: exactly one probe goes out"""
+        breaker = NYCApiBreaker(fail_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        breaker.opened_at -= 1.0  # Cooldown already elapsed
+        start = threading.Barrier(8)
+        allowed = []
+
+        def caller():
+            start.wait()
+            allowed.append(breaker.allow())
+
+        threads = [threading.Thread(target=caller) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert allowed.count(True) == 1
+        assert breaker.state == NYCApiBreaker.HALF_OPEN
+
+        breaker.record_success()
+        assert breaker.allow() is True
+
+    def test_lost_probe_frees_slot_after_cooldown(self):
+        """A probe that never reports doesn't wedge the breaker half-open"""
+        breaker = NYCApiBreaker(fail_threshold=1, reset_timeout=30.0)
+        breaker.record_failure()
+        breaker.opened_at -= 60.0
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+
+        breaker.probe_started_at -= 60.0
+        assert breaker.allow() is True
+
+    def test_concurrent_failures_counted_exactly(self):
+        """record_failure from many threads loses no updates"""
+        breaker = NYCApiBreaker(fail_threshold=10**9)
+
+        def fail_many():
+            for _ in range(10000):
+                breaker.record_failure()
+
+        threads = [threading.Thread(target=fail_many) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert breaker.failure_count == 40000
+        assert breaker.state == NYCApiBreaker.CLOSED
+
+    def test_straggler_failure_does_not_extend_open(self):
+        """Failures reported while already open don't count as another trip"""
+        breaker = NYCApiBreaker(fail_threshold=1, reset_timeout=30.0)
+        breaker.record_failure()
+        opened_at = breaker.opened_at
+
+        breaker.record_failure()
+
+        assert breaker.trip_count == 1
+        assert breaker.opened_at == opened_at
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -5,7 +5,6 @@ Tests the integration of Sentinel-Scope monitoring into ConComplyAi
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
-import tempfile
 import os
 
 from core.services import SentinelService
@@ -16,17 +15,27 @@ from core.services.sentinel_service import (
 )
 
 
+@pytest.fixture
+def service():
+    """Fresh SentinelService with the default watch config (tests mutate it)"""
+    return SentinelService()
+
+
+@pytest.fixture(scope="session")
+def pristine_service():
+    """Shared SentinelService for read-only checks; never mutate it"""
+    return SentinelService()
+
+
 class TestSentinelServiceInitialization:
     """Test SentinelService initialization and configuration"""
     
-    def test_default_initialization(self):
+    def test_default_initialization(self, pristine_service):
         """Test service initializes with default config"""
-        service = SentinelService()
-        
-        assert service.watch_config is not None
-        assert service.monitoring_events == []
-        assert service.is_monitoring is False
-        assert service._callbacks == []
+        assert pristine_service.watch_config is not None
+        assert pristine_service.monitoring_events == []
+        assert pristine_service.is_monitoring is False
+        assert pristine_service._callbacks == []
     
     def test_custom_config_initialization(self):
         """Test service initializes with custom config"""
@@ -47,9 +56,8 @@ class TestSentinelServiceInitialization:
 class TestExpirationTracking:
     """Test expiration tracking and warnings"""
     
-    def test_add_expiring_item(self):
+    def test_add_expiring_item(self, service):
         """Test adding item to expiration tracking"""
-        service = SentinelService()
         exp_date = datetime.now() + timedelta(days=20)
         
         service.add_expiring_item(
@@ -62,106 +70,52 @@ class TestExpirationTracking:
         assert len(service._expiring_items) == 1
         assert service._expiring_items[0]['item_id'] == 'COI-001'
     
-    def test_expiration_warning_within_30_days(self):
-        """Test warning generated for items expiring within 30 days"""
-        service = SentinelService()
-        exp_date = datetime.now() + timedelta(days=25)
-        
+    @pytest.mark.parametrize("days, expected_warnings, expected_priority", [
+        (25, 1, 2),    # Within 30 days
+        (5, 1, 1),     # 7 days or less is critical
+        (1, 1, 1),
+        (45, 0, None), # Beyond 30 days
+    ])
+    def test_expiration_thresholds(self, service, days, expected_warnings, expected_priority):
+        """Test warning count and priority across the 7/30 day thresholds"""
         service.add_expiring_item(
             item_id='COI-001',
             item_type='COI',
-            expiration_date=exp_date
-        )
-        
-        warnings = service.check_expirations()
-        
-        assert len(warnings) == 1
-        assert warnings[0].event_type == MonitoringEventType.EXPIRATION_WARNING
-        # Allow for rounding in days calculation (24 or 25 is acceptable)
-        assert warnings[0].data['days_until_expiration'] in [24, 25]
-    
-    def test_critical_priority_for_7_days_or_less(self):
-        """Test critical priority for items expiring in 7 days or less"""
-        service = SentinelService()
-        exp_date = datetime.now() + timedelta(days=5)
-        
-        service.add_expiring_item(
-            item_id='LIC-001',
-            item_type='License',
-            expiration_date=exp_date
-        )
-        
-        warnings = service.check_expirations()
-        
-        assert len(warnings) == 1
-        assert warnings[0].priority == 1  # Critical
-    
-    def test_no_warning_beyond_30_days(self):
-        """Test no warning for items expiring beyond 30 days"""
-        service = SentinelService()
-        exp_date = datetime.now() + timedelta(days=45)
-        
-        service.add_expiring_item(
-            item_id='COI-002',
-            item_type='COI',
-            expiration_date=exp_date
+            expiration_date=datetime.now() + timedelta(days=days)
         )
         
         warnings = service.check_expirations()
         
-        assert len(warnings) == 0
+        assert len(warnings) == expected_warnings
+        if expected_warnings:
+            assert warnings[0].event_type == MonitoringEventType.EXPIRATION_WARNING
+            assert warnings[0].priority == expected_priority
+            # Allow for rounding in days calculation (days - 1 or days is acceptable)
+            assert warnings[0].data['days_until_expiration'] in [days - 1, days]
 
 
 class TestDirectoryWatching:
     """Test file system watching capabilities"""
     
-    def test_watch_directory_detects_pdf(self):
-        """Test detecting PDF files in directory"""
-        service = SentinelService()
-        
-        # Create temp directory with test file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test_document.pdf"
-            test_file.touch()
-            
-            events = service.watch_directory(tmpdir)
-            
-            assert len(events) == 1
-            assert events[0].event_type == MonitoringEventType.DOCUMENT_DETECTED
-            assert 'test_document.pdf' in events[0].source
-    
-    def test_watch_directory_multiple_files(self):
-        """Test detecting multiple files"""
-        service = SentinelService()
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            (Path(tmpdir) / "doc1.pdf").touch()
-            (Path(tmpdir) / "doc2.jpg").touch()
-            (Path(tmpdir) / "doc3.png").touch()
-            
-            events = service.watch_directory(tmpdir)
+    @pytest.mark.parametrize("filenames, expected_per_scan", [
+        (["test_document.pdf"], [1]),                 # Single PDF
+        (["doc1.pdf", "doc2.jpg", "doc3.png"], [3]),  # Multiple file types
+        (["test.pdf"], [1, 0]),                       # Rescan ignores duplicates
+    ])
+    def test_watch_directory(self, service, tmp_path, filenames, expected_per_scan):
+        """Test detected event counts per scan for the files in a directory"""
+        for name in filenames:
+            (tmp_path / name).write_bytes(b"")
+        
+        for scan, expected in enumerate(expected_per_scan):
+            events = service.watch_directory(str(tmp_path))
             
-            assert len(events) == 3
+            assert len(events) == expected, f"scan {scan}: expected {expected} events"
+            assert all(e.event_type == MonitoringEventType.DOCUMENT_DETECTED for e in events)
+            assert sorted(Path(e.source).name for e in events) == (sorted(filenames) if expected else [])
     
-    def test_watch_directory_ignores_duplicates(self):
-        """Test that already-detected files are not reported again"""
-        service = SentinelService()
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.pdf"
-            test_file.touch()
-            
-            # First scan
-            events1 = service.watch_directory(tmpdir)
-            assert len(events1) == 1
-            
-            # Second scan - should not detect again
-            events2 = service.watch_directory(tmpdir)
-            assert len(events2) == 0
-    
-    def test_watch_nonexistent_directory(self):
+    def test_watch_nonexistent_directory(self, service):
         """Test watching non-existent directory returns empty"""
-        service = SentinelService()
         events = service.watch_directory('/nonexistent/path')
         
         assert len(events) == 0
@@ -170,10 +124,8 @@ class TestDirectoryWatching:
 class TestEventManagement:
     """Test event creation, retrieval, and processing"""
     
-    def test_report_compliance_event(self):
+    def test_report_compliance_event(self, service):
         """Test reporting compliance violation"""
-        service = SentinelService()
-        
         event = service.report_compliance_event(
             site_id='SITE-001',
             violation_data={
@@ -187,10 +139,8 @@ class TestEventManagement:
         assert event.source == 'SITE-001'
         assert event.priority == 1
     
-    def test_get_live_feed_returns_recent_events(self):
+    def test_get_live_feed_returns_recent_events(self, service):
         """Test retrieving live feed of events"""
-        service = SentinelService()
-        
         # Create multiple events
         for i in range(5):
             service.report_compliance_event(
@@ -203,10 +153,8 @@ class TestEventManagement:
         assert len(feed) == 3
         # Should be sorted by timestamp descending (most recent first)
     
-    def test_get_live_feed_unprocessed_only(self):
+    def test_get_live_feed_unprocessed_only(self, service):
         """Test filtering to unprocessed events only"""
-        service = SentinelService()
-        
         # Create and process some events
         event1 = service.report_compliance_event('SITE-1', {'risk_level': 2})
         event2 = service.report_compliance_event('SITE-2', {'risk_level': 2})
@@ -218,10 +166,8 @@ class TestEventManagement:
         assert len(feed) == 1
         assert feed[0].event_id == event2.event_id
     
-    def test_mark_processed(self):
+    def test_mark_processed(self, service):
         """Test marking event as processed"""
-        service = SentinelService()
-        
         event = service.report_compliance_event('SITE-1', {'risk_level': 2})
         assert event.processed is False
         
@@ -237,20 +183,17 @@ class TestEventManagement:
 class TestStatistics:
     """Test statistics and reporting"""
     
-    def test_get_statistics_empty(self):
+    def test_get_statistics_empty(self, pristine_service):
         """Test statistics with no events"""
-        service = SentinelService()
-        stats = service.get_statistics()
+        stats = pristine_service.get_statistics()
         
         assert stats['total_events'] == 0
         assert stats['unprocessed_events'] == 0
         assert stats['critical_events'] == 0
         assert stats['monitoring_active'] is False
     
-    def test_get_statistics_with_events(self):
+    def test_get_statistics_with_events(self, service):
         """Test statistics with various events"""
-        service = SentinelService()
-        
         # Create events with different priorities
         service.report_compliance_event('SITE-1', {'risk_level': 1})  # Critical
         service.report_compliance_event('SITE-2', {'risk_level': 3})
@@ -267,49 +210,24 @@ class TestStatistics:
 class TestCallbacks:
     """Test callback registration and execution"""
     
-    def test_register_callback(self):
-        """Test registering event callback"""
-        service = SentinelService()
-        
+    @pytest.mark.parametrize("n_callbacks", [1, 2, 4])
+    def test_callbacks_invoked(self, service, n_callbacks):
+        """Test every registered callback receives the reported event"""
         called = []
         
-        def callback(event):
-            called.append(event.event_id)
-        
-        service.register_callback(callback)
+        for _ in range(n_callbacks):
+            service.register_callback(lambda event: called.append(event.event_id))
         
         event = service.report_compliance_event('SITE-1', {'risk_level': 2})
         
-        assert len(called) == 1
-        assert called[0] == event.event_id
-    
-    def test_multiple_callbacks(self):
-        """Test multiple callbacks are all invoked"""
-        service = SentinelService()
-        
-        call_count = {'count': 0}
-        
-        def callback1(event):
-            call_count['count'] += 1
-        
-        def callback2(event):
-            call_count['count'] += 1
-        
-        service.register_callback(callback1)
-        service.register_callback(callback2)
-        
-        service.report_compliance_event('SITE-1', {'risk_level': 2})
-        
-        assert call_count['count'] == 2
+        assert called == [event.event_id] * n_callbacks
 
 
 class TestUnifiedIngestion:
     """Test unified ingestion triggering"""
     
-    def test_trigger_extraction_for_document_event(self):
+    def test_trigger_extraction_for_document_event(self, service):
         """Test triggering extraction for document detection"""
-        service = SentinelService()
-        
         event = MonitoringEvent(
             event_id='DOC-123',
             event_type=MonitoringEventType.DOCUMENT_DETECTED,
@@ -326,10 +244,8 @@ class TestUnifiedIngestion:
         assert result['file_path'] == '/path/to/doc.pdf'
         assert result['trigger_source'] == 'sentinel_monitoring'
     
-    def test_trigger_extraction_wrong_event_type(self):
+    def test_trigger_extraction_wrong_event_type(self, service):
         """Test error when triggering extraction for non-document event"""
-        service = SentinelService()
-        
         event = MonitoringEvent(
             event_id='COMP-123',
             event_type=MonitoringEventType.COMPLIANCE_VIOLATION,
@@ -345,7 +261,7 @@ class TestUnifiedIngestion:
 class TestIntegration:
     """Integration tests for complete workflows"""
     
-    def test_full_document_detection_workflow(self):
+    def test_full_document_detection_workflow(self, tmp_path):
         """Test complete workflow: detection -> callback -> extraction"""
         service = SentinelService(
             watch_config=WatchConfig(auto_trigger_extraction=True)
@@ -361,20 +277,17 @@ class TestIntegration:
         service.register_callback(on_document)
         
         # Create test document
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "contract.pdf"
-            test_file.touch()
-            
-            events = service.watch_directory(tmpdir)
-            
-            assert len(events) == 1
-            assert len(triggered) == 1
-            assert triggered[0]['file_path'] == str(test_file)
+        test_file = tmp_path / "contract.pdf"
+        test_file.touch()
+        
+        events = service.watch_directory(str(tmp_path))
+        
+        assert len(events) == 1
+        assert len(triggered) == 1
+        assert triggered[0]['file_path'] == str(test_file)
     
-    def test_expiration_workflow_with_statistics(self):
+    def test_expiration_workflow_with_statistics(self, service):
         """Test expiration tracking reflected in statistics"""
-        service = SentinelService()
-        
         # Add expiring items
         service.add_expiring_item(
             'COI-1', 'COI',
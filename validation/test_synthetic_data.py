@@ -7,13 +7,46 @@ from core.synthetic_generator import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _seed_random():
+    """Re-seed per test so results don't depend on test order"""
+    random.seed(42)
+    yield
+
+
+@pytest.fixture(scope="module")
+def gen():
+    """Single seeded generator shared by tests that only inspect its output"""
+    return SyntheticViolationGenerator(seed=42)
+
+
+@pytest.fixture(scope="module")
+def all_violations(gen):
+    """One generated scenario per violation type"""
+    return {vt: gen.generate_violation_scenario(vt) for vt in ViolationType}
+
+
+@pytest.fixture(scope="module")
+def sites_by_difficulty(gen):
+    """One generated site per difficulty level"""
+    return {
+        d: gen.generate_construction_site_scenario(f"{d.upper()}-001", difficulty=d)
+        for d in ("easy", "medium", "hard", "extreme")
+    }
+
+
+@pytest.fixture(scope="module")
+def dataset(gen):
+    """Training dataset shared by the site-structure tests"""
+    return gen.generate_training_dataset(num_samples=20)
+
+
 class TestSyntheticDataGeneration:
     """Test suite for synthetic data generation system"""
     
-    def test_single_violation_generation(self):
+    def test_single_violation_generation(self, all_violations):
         """Verify single violation generation produces valid data"""
-        generator = SyntheticViolationGenerator(seed=42)
-        violation = generator.generate_violation_scenario(ViolationType.SCAFFOLDING)
+        violation = all_violations[ViolationType.SCAFFOLDING]
         
         # Verify required fields
         assert "violation_id" in violation
@@ -29,16 +62,12 @@ class TestSyntheticDataGeneration:
         assert violation["estimated_fine"] > 0
         assert violation["synthetic"] is True
     
-    def test_site_scenario_generation(self):
+    def test_site_scenario_generation(self, sites_by_difficulty):
         """Verify complete site scenario generation"""
-        generator = SyntheticViolationGenerator(seed=42)
-        site = generator.generate_construction_site_scenario(
-            site_id="TEST-SITE-001",
-            difficulty="medium"
-        )
+        site = sites_by_difficulty["medium"]
         
         # Verify site structure
-        assert site["site_id"] == "TEST-SITE-001"
+        assert site["site_id"] == "MEDIUM-001"
         assert site["synthetic"] is True
         assert "violations" in site
         assert "metadata" in site
@@ -50,28 +79,20 @@ class TestSyntheticDataGeneration:
         assert "construction_phase" in metadata
         assert "worker_count" in metadata
     
-    def test_violation_type_coverage(self):
+    def test_violation_type_coverage(self, all_violations):
         """Verify all violation types can be generated"""
-        generator = SyntheticViolationGenerator(seed=42)
-        
-        for violation_type in ViolationType:
-            violation = generator.generate_violation_scenario(violation_type)
-            assert violation is not None, f"Failed to generate {violation_type}"
-            assert violation["category"] is not None
+        failed = [
+            vt for vt, violation in all_violations.items()
+            if violation is None or violation["category"] is None
+        ]
+        assert set(all_violations) == set(ViolationType)
+        assert not failed, f"Failed to generate {failed}"
     
-    def test_difficulty_levels(self):
+    def test_difficulty_levels(self, sites_by_difficulty):
         """Verify different difficulty levels produce appropriate scenarios"""
-        generator = SyntheticViolationGenerator(seed=42)
-        
-        easy_site = generator.generate_construction_site_scenario(
-            "EASY-001", difficulty="easy"
-        )
-        hard_site = generator.generate_construction_site_scenario(
-            "HARD-001", difficulty="hard"
-        )
-        extreme_site = generator.generate_construction_site_scenario(
-            "EXTREME-001", difficulty="extreme"
-        )
+        easy_site = sites_by_difficulty["easy"]
+        hard_site = sites_by_difficulty["hard"]
+        extreme_site = sites_by_difficulty["extreme"]
         
         # Hard should generally have more violations than easy
         # (not strict due to randomness, but checking structure)
@@ -83,11 +104,8 @@ class TestSyntheticDataGeneration:
         assert hard_site["difficulty"] == "hard"
         assert extreme_site["difficulty"] == "extreme"
     
-    def test_training_dataset_generation(self):
+    def test_training_dataset_generation(self, dataset):
         """Verify training dataset generation produces consistent results"""
-        generator = SyntheticViolationGenerator(seed=42)
-        dataset = generator.generate_training_dataset(num_samples=20)
-        
         assert len(dataset) == 20, f"Expected 20 samples, got {len(dataset)}"
         
         # Verify all samples have required structure
@@ -114,45 +132,34 @@ class TestSyntheticDataGeneration:
         assert len(site1["violations"]) > 0
         assert len(site2["violations"]) > 0
     
-    def test_privacy_compliance_markers(self):
+    def test_privacy_compliance_markers(self, dataset):
         """Verify synthetic data includes privacy compliance markers"""
-        generator = SyntheticViolationGenerator(seed=42)
-        site = generator.generate_construction_site_scenario("PRIVACY-001")
-        
-        # Verify privacy markers
-        assert "synthetic" in site
-        assert site["synthetic"] is True
-        assert "privacy_note" in site
-        assert "no real construction sites" in site["privacy_note"].lower()
+        for site in dataset:
+            # Verify privacy markers
+            assert "synthetic" in site
+            assert site["synthetic"] is True
+            assert "privacy_note" in site
+            assert "no real construction sites" in site["privacy_note"].lower()
     
-    def test_osha_code_inclusion(self):
+    def test_osha_code_inclusion(self, all_violations):
         """Verify violations include OSHA codes for realism"""
-        generator = SyntheticViolationGenerator(seed=42)
-        
-        violation = generator.generate_violation_scenario(ViolationType.FALL_PROTECTION)
+        violation = all_violations[ViolationType.FALL_PROTECTION]
         assert "osha_code" in violation
         assert violation["osha_code"].startswith("1926")  # OSHA construction codes
     
-    def test_edge_case_generation(self):
+    def test_edge_case_generation(self, sites_by_difficulty):
         """Verify extreme difficulty generates challenging edge cases"""
-        generator = SyntheticViolationGenerator(seed=42)
-        
-        extreme_site = generator.generate_construction_site_scenario(
-            "EDGE-001", 
-            difficulty="extreme"
-        )
+        extreme_site = sites_by_difficulty["extreme"]
         
         # Extreme should have multiple violations
         assert len(extreme_site["violations"]) >= 3, \
             f"Extreme difficulty should have >=3 violations, got {len(extreme_site['violations'])}"
     
-    def test_data_augmentation_purpose(self):
+    def test_data_augmentation_purpose(self, dataset):
         """Verify generated data includes augmentation purpose"""
-        generator = SyntheticViolationGenerator(seed=42)
-        site = generator.generate_construction_site_scenario("AUG-001")
-        
-        assert "augmentation_purpose" in site
-        assert "edge case" in site["augmentation_purpose"].lower()
+        for site in dataset:
+            assert "augmentation_purpose" in site
+            assert "edge case" in site["augmentation_purpose"].lower()
 
 
 if __name__ == "__main__":
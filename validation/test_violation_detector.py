@@ -0,0 +1,202 @@
+"""Tests for the violation detector's NYC API path"""
+import asyncio
+import queue
+import socket
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from pybreaker import CircuitBreakerError
+
+import core.agents.violation_detector as vd
+from core.config import BUSINESS_CONFIG, MockNYCApiClient, NYCApiBreaker
+from core.models import ConstructionState
+from core.supervisor import run_batch_compliance
+
+
+@pytest.fixture
+def fresh_api_state(monkeypatch):
+    """Isolate the module-level breaker/pool and skip backoff sleeps"""
+    monkeypatch.setattr(vd, "_NYC_API_BREAKER", NYCApiBreaker(fail_threshold=5, reset_timeout=30.0))
+    monkeypatch.setattr(vd, "_API_CLIENT_POOL", queue.SimpleQueue())
+    monkeypatch.setitem(BUSINESS_CONFIG["retry_limits"], "max_backoff", 0)
+
+
+def _gaierror_cause() -> ConnectionError:
+    error = ConnectionError("NYC API host lookup failed")
+    error.__cause__ = socket.gaierror("Name or service not known")
+    return error
+
+
+def _detect(site_id: str) -> dict:
+    state = ConstructionState(site_id=site_id, processing_start=datetime.now())
+    return asyncio.run(vd.detect_violations(state))
+
+
+class TestViolationDetector:
+    """Test permit fetch behaviour around retries, pooling and limits"""
+
+    def test_permit_data_deterministic_per_site(self, fresh_api_state):
+        """A repeat run of a site (vision cache hit) draws the same permit"""
+        first = _detect("SITE-DET-001")
+        second = _detect("SITE-DET-001")
+
+        assert first["agent_errors"] == second["agent_errors"]
+        if first["permit_data"] is None:
+            assert second["permit_data"] is None
+        else:
+            assert second["permit_data"].permit_number == first["permit_data"].permit_number
+            assert second["permit_data"].status == first["permit_data"].status
+
+    def test_batch_permit_data_reproducible(self, fresh_api_state, monkeypatch):
+        """Concurrent batch runs give each site the same permit every time"""
+        # Keep the shared breaker out of it: which sites it cuts off depends
+        # on how failures interleave, not on the per-site draws under test
+        monkeypatch.setattr(vd, "_NYC_API_BREAKER", NYCApiBreaker(fail_threshold=1000))
+        site_ids = [f"SITE-BATCH-{i:03d}" for i in range(8)]
+
+        def permits():
+            return [
+                (r.site_id, r.permit_data.permit_number if r.permit_data else None)
+                for r in run_batch_compliance(site_ids)
+            ]
+
+        assert permits() == permits()
+
+    @pytest.mark.parametrize("error_factory", [
+        _gaierror_cause,
+        lambda: ConnectionError("NYC API permanent failure: key revoked"),
+    ], ids=["gaierror-cause", "permanent-message"])
+    def test_permanent_error_stops_after_one_attempt(
+        self, fresh_api_state, monkeypatch, error_factory
+    ):
+        """DNS failures and errors marked permanent are not retried"""
+        calls = []
+
+        def failing_call(self, site_id, rng=None):
+            self.call_count += 1
+            calls.append(site_id)
+            raise error_factory()
+
+        monkeypatch.setattr(MockNYCApiClient, "get_permit_violations", failing_call)
+        result = _detect("SITE-PERM-001")
+
+        assert len(calls) == 1
+        assert result["permit_data"] is None
+        assert any("failed permanently" in e for e in result["agent_errors"])
+        assert result["agent_outputs"][-1].data["api_calls"] == 1
+
+    def test_client_breaker_error_retried_and_not_counted(self, fresh_api_state, monkeypatch):
+        """A client's own open breaker is retried and leaves the shared breaker alone"""
+        calls = []
+
+        def breaker_open_call(self, site_id, rng=None):
+            self.call_count += 1
+            calls.append(site_id)
+            raise CircuitBreakerError("client breaker open")
+
+        monkeypatch.setattr(MockNYCApiClient, "get_permit_violations", breaker_open_call)
+        result = _detect("SITE-CB-001")
+
+        assert len(calls) == BUSINESS_CONFIG["retry_limits"]["max_attempts"]
+        assert vd._NYC_API_BREAKER.failure_count == 0
+        assert vd._NYC_API_BREAKER.state == NYCApiBreaker.CLOSED
+        assert not any("permanently" in e for e in result["agent_errors"])
+
+    def test_bulkhead_caps_concurrent_permit_fetches(self, fresh_api_state, monkeypatch):
+        """No more than max_concurrent permit fetches are in flight at once"""
+        monkeypatch.setitem(BUSINESS_CONFIG["retry_limits"], "max_concurrent", 2)
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def slow_call(self, site_id, rng=None):
+            nonlocal in_flight, peak
+            self.call_count += 1
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return None
+
+        monkeypatch.setattr(MockNYCApiClient, "get_permit_violations", slow_call)
+
+        async def run_sites():
+            return await asyncio.gather(*[
+                vd.detect_violations(
+                    ConstructionState(site_id=f"SITE-BH-{i}", processing_start=datetime.now())
+                )
+                for i in range(6)
+            ])
+
+        results = asyncio.run(run_sites())
+
+        assert len(results) == 6
+        assert peak == 2
+        # Clients are taken inside the bulkhead, so the pool never outgrows it
+        assert vd._API_CLIENT_POOL.qsize() == 2
+
+    def test_backoff_jitter_draws_from_capped_window(self, fresh_api_state, monkeypatch):
+        """With jitter on, each retry sleeps uniform(0, capped backoff)"""
+        monkeypatch.setitem(BUSINESS_CONFIG["retry_limits"], "max_backoff", 0.01)
+        draws = []
+
+        class RecordingRng:
+            def uniform(self, low, high):
+                draws.append((low, high))
+                return 0.0
+
+        def failing_call(self, site_id, rng=None):
+            self.call_count += 1
+            raise ConnectionError("NYC API unavailable")
+
+        monkeypatch.setattr(vd, "_BACKOFF_RNG", RecordingRng())
+        monkeypatch.setattr(MockNYCApiClient, "get_permit_violations", failing_call)
+        _detect("SITE-JIT-001")
+
+        retries = BUSINESS_CONFIG["retry_limits"]["max_attempts"] - 1
+        assert draws == [(0, 0.01)] * retries
+
+        draws.clear()
+        monkeypatch.setitem(BUSINESS_CONFIG["retry_limits"], "jitter", False)
+        _detect("SITE-JIT-001")
+        assert draws == []
+
+    def test_api_client_reused_across_sites(self, fresh_api_state, monkeypatch):
+        """Sequential sites share one pooled client, without its own breaker"""
+        def ok_call(self, site_id, rng=None):
+            self.call_count += 1
+            return None
+
+        monkeypatch.setattr(MockNYCApiClient, "get_permit_violations", ok_call)
+        first = _detect("SITE-POOL-001")
+        second = _detect("SITE-POOL-002")
+
+        assert vd._API_CLIENT_POOL.qsize() == 1
+        client = vd._API_CLIENT_POOL.get_nowait()
+        assert client.call_count == 2
+        assert client.circuit_breaker is None
+        # api_calls is per site, not the pooled client's running total
+        assert first["agent_outputs"][-1].data["api_calls"] == 1
+        assert second["agent_outputs"][-1].data["api_calls"] == 1
+
+    def test_duration_ns_covers_permit_fetch(self, fresh_api_state, monkeypatch):
+        """duration_ns reports wall time including the permit fetch"""
+        def slow_call(self, site_id, rng=None):
+            self.call_count += 1
+            time.sleep(0.02)
+            return None
+
+        monkeypatch.setattr(MockNYCApiClient, "get_permit_violations", slow_call)
+        result = _detect("SITE-DUR-001")
+
+        duration_ns = result["agent_outputs"][-1].data["duration_ns"]
+        assert isinstance(duration_ns, int)
+        assert duration_ns >= 20_000_000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])